@@ -27,17 +27,23 @@ Version: 2.0
 """
 
 import logging
-from flask import Flask, request, jsonify, g
-from flask_cors import CORS
+import threading
+from collections import OrderedDict
+from functools import lru_cache, partial
+from typing import Any, Dict, Optional, Tuple, Union
+
+import orjson
+from flask import Flask, Response, request, jsonify, g, current_app
+from flask.json.provider import DefaultJSONProvider
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 
 from config import get_config
 from prompt_optimizer import PromptOptimizationSystem
 from services.llm_service import LLMService, LLMError
-from middleware.logging_middleware import setup_logging, RequestLoggingMiddleware
+from middleware.logging_middleware import setup_logging, init_request_logging
 from middleware.validation import (
-    validate_prompt_input,
+    validate_prompt_request,
     validate_content_type,
     validate_framework_id,
     ValidationError,
@@ -50,9 +56,76 @@ from middleware.validation import (
 # Using globals allows access from route handlers while maintaining testability.
 
 prompt_system: PromptOptimizationSystem = None  # Framework detection & optimization
-llm_service: LLMService = None                   # Groq/LLM API integration
+llm_service: LLMService = None                   # Groq/LLM API integration (lazy)
+llm_factory = None                               # Builds llm_service on first /chat
 limiter: Limiter = None                          # Rate limiting middleware
 
+_llm_lock = threading.Lock()
+
+
+# =============================================================================
+# JSON PROVIDER
+# =============================================================================
+
+class ORJSONProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson.
+    
+    orjson serializes dicts/lists several times faster than the stdlib
+    json module, which matters for /frameworks and /chat metadata. Types
+    orjson does not know natively fall back to Flask's default handler.
+    
+    Keys stay sorted (sort_keys) as with Flask's provider. orjson has no
+    ensure_ascii mode, so non-ASCII text is emitted as raw UTF-8 instead
+    of \\uXXXX escapes; responses are served as UTF-8 either way.
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        option = orjson.OPT_NON_STR_KEYS
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2  # Pretty output in debug mode
+        return orjson.dumps(obj, default=self.default, option=option).decode("utf-8")
+
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+
+# =============================================================================
+# RESULT CACHE
+# =============================================================================
+
+class ProcessCache:
+    """
+    Bounded LRU of optimization results keyed by (prompt, framework).
+    
+    One instance lives on each app (app.extensions["process_cache"]);
+    entries are (json_bytes, result_dict) pairs shared across requests.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Tuple[str, Optional[str]], Tuple[bytes, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Tuple[str, Optional[str]]) -> Optional[Tuple[bytes, Dict[str, Any]]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: Tuple[str, Optional[str]], entry: Tuple[bytes, Dict[str, Any]]) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
 
 # =============================================================================
 # APPLICATION FACTORY
@@ -81,9 +154,10 @@ def create_app(config=None):
         from config import TestingConfig
         test_app = create_app(TestingConfig())
     """
-    global prompt_system, llm_service, limiter
+    global prompt_system, llm_service, llm_factory, limiter
 
     app = Flask(__name__)
+    app.json = ORJSONProvider(app)
 
     # -------------------------------------------------------------------------
     # Configuration Loading
@@ -97,6 +171,7 @@ def create_app(config=None):
     app.config["MAX_PROMPT_LENGTH"] = config.MAX_PROMPT_LENGTH
     app.config["MIN_PROMPT_LENGTH"] = config.MIN_PROMPT_LENGTH
     app.config["TESTING"] = config.TESTING
+    app.config["LOG_SAMPLE_RATE"] = config.LOG_SAMPLE_RATE
 
     # -------------------------------------------------------------------------
     # Logging Setup
@@ -116,32 +191,48 @@ def create_app(config=None):
     # Rate Limiting
     # -------------------------------------------------------------------------
     # Protect against abuse by limiting requests per IP address
-    # Uses in-memory storage (consider Redis for production clusters)
+    # Storage is shared across workers when RATE_LIMIT_STORAGE_URI is redis://
+    # (one connection pool serves every @limiter.limit decorator)
+
+    # Resolve the client IP once per request; registered before the limiter
+    # so its checks (and the 429 log line) read the cached value
+    @app.before_request
+    def cache_client_ip():
+        g.client_ip = get_remote_address()
+
     limiter = Limiter(
-        key_func=get_remote_address,  # Rate limit by client IP
+        key_func=_client_ip,  # Rate limit by client IP
         app=app,
         default_limits=[config.RATE_LIMIT_DEFAULT],  # e.g., "100 per hour"
-        storage_uri="memory://",  # In-memory storage (use redis:// for production)
+        storage_uri=config.RATE_LIMIT_STORAGE_URI,  # memory:// or redis://
+        strategy=config.RATE_LIMIT_STRATEGY,  # Rolling window, not fixed buckets
     )
 
     # -------------------------------------------------------------------------
     # Middleware Registration
     # -------------------------------------------------------------------------
     # Add request logging with timing and unique request IDs
-    RequestLoggingMiddleware(app)
+    init_request_logging(app)
     
     # -------------------------------------------------------------------------
     # CORS Headers (registered AFTER other middleware to run LAST)
     # -------------------------------------------------------------------------
+    # Origins and the static header block are built once here, so the hook
+    # only does a hash lookup and a single header append per request
+    allowed_origins = config.ALLOWED_ORIGINS  # frozenset in every config class
+    cors_headers = (
+        ("Access-Control-Allow-Methods", "GET, POST, OPTIONS"),
+        ("Access-Control-Allow-Headers", "Content-Type, Authorization, X-Request-ID"),
+        ("Access-Control-Expose-Headers", "X-Request-ID, X-Response-Time"),
+        ("Access-Control-Allow-Credentials", "true"),
+    )
+
     @app.after_request
     def add_cors_headers(response):
         origin = request.headers.get("Origin")
-        if origin and origin in config.ALLOWED_ORIGINS:
+        if origin and origin in allowed_origins:
             response.headers["Access-Control-Allow-Origin"] = origin
-            response.headers["Access-Control-Allow-Methods"] = "GET, POST, OPTIONS"
-            response.headers["Access-Control-Allow-Headers"] = "Content-Type, Authorization, X-Request-ID"
-            response.headers["Access-Control-Expose-Headers"] = "X-Request-ID, X-Response-Time"
-            response.headers["Access-Control-Allow-Credentials"] = "true"
+            response.headers.extend(cors_headers)
         return response
 
     # -------------------------------------------------------------------------
@@ -150,10 +241,27 @@ def create_app(config=None):
     # Initialize the prompt optimization system (framework detection)
     prompt_system = PromptOptimizationSystem()
 
-    # Initialize LLM service if API key is available
+    # Optimization is deterministic per (prompt, framework), so repeated
+    # prompts (UI retries, bots) are served from a bounded LRU cache
+    app.extensions["process_cache"] = ProcessCache(config.PROCESS_CACHE_SIZE)
+
+    # Framework metadata is immutable after startup, so serialize the
+    # /frameworks and /frameworks/<id> payloads once instead of per request
+    frameworks = prompt_system.list_available_frameworks()
+    app.config["_FRAMEWORKS_JSON"] = _dump_json(frameworks)
+    app.config["_FRAMEWORK_BY_ID_JSON"] = {
+        fw["id"]: _dump_json(prompt_system.get_framework_by_id(fw["id"]))
+        for fw in frameworks
+    }
+
+    # Prepare the LLM service if an API key is available
     # The /chat endpoint requires this; /optimize works without it
+    # The service (and its HTTP connection pool) is built on the first /chat
+    # request, so workers that never serve /chat never allocate it
+    llm_service = None
     if config.GROQ_API_KEY:
-        llm_service = LLMService(
+        llm_factory = partial(
+            LLMService,
             api_key=config.GROQ_API_KEY,
             api_url=config.GROQ_API_URL,
             model=config.GROQ_MODEL,
@@ -161,7 +269,19 @@ def create_app(config=None):
         )
     else:
         app.logger.warning("GROQ_API_KEY not set - /chat endpoint will be unavailable")
-        llm_service = None
+        llm_factory = None
+
+    # The info payloads depend only on startup state, so serialize them once
+    # (load balancers hit /health several times per second)
+    app.config["_ROOT_JSON"] = _dump_json({
+        "service": "CruxEn Prompt Optimization API",
+        "version": "2.0",
+        "status": "running",
+    })
+    app.config["_HEALTH_JSON"] = _dump_json({
+        "status": "healthy",
+        "llm_available": llm_factory is not None,
+    })
 
     # -------------------------------------------------------------------------
     # Register Handlers and Routes
@@ -172,6 +292,86 @@ def create_app(config=None):
     return app
 
 
+def get_llm_service() -> Optional[LLMService]:
+    """
+    Return the LLM service, constructing it on first use.
+    
+    Returns:
+        LLMService or None if no API key is configured
+    """
+    global llm_service
+    if llm_service is None and llm_factory is not None:
+        with _llm_lock:
+            if llm_service is None:
+                llm_service = llm_factory()
+    return llm_service
+
+
+def _client_ip() -> str:
+    """Client IP for the current request, as cached by cache_client_ip."""
+    client_ip = g.get("client_ip")
+    if client_ip is None:
+        client_ip = g.client_ip = get_remote_address()
+    return client_ip
+
+
+def _dump_json(payload) -> bytes:
+    """Serialize a payload to JSON bytes, bypassing the jsonify indirection."""
+    return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+
+
+@lru_cache(maxsize=32)
+def _rate_limit_body(retry_after: str) -> bytes:
+    """
+    Serialized 429 body for a limit description (e.g. "60 per 1 minute").
+    
+    There are only a handful of configured limits, so throttled clients
+    get a prebuilt payload instead of a fresh jsonify() per rejection.
+    """
+    return _dump_json({
+        "error": "Rate limit exceeded. Please try again later.",
+        "retry_after": retry_after,
+    })
+
+
+def _process_prompt(
+    prompt: str, explicit_framework: Optional[str]
+) -> Tuple[bytes, Dict[str, Any]]:
+    """
+    Run the optimization system and freeze the result for caching.
+    
+    Returns the serialized JSON alongside the result dict. The bytes are
+    served as-is by /optimize; the dict is shared between cache hits and
+    must be treated as read-only by callers.
+    """
+    result = prompt_system.process(prompt, explicit_framework=explicit_framework)
+    return _dump_json(result), result
+
+
+def process_prompt(
+    prompt: str, explicit_framework: Optional[str]
+) -> Tuple[bytes, Dict[str, Any]]:
+    """
+    Cached front for _process_prompt.
+    
+    Only final results are memoized: dynamic (LLM) output, or static output
+    when no LLM is configured. A static fallback produced while the LLM is
+    failing is returned but not stored, so the prompt gets a dynamic result
+    once the provider recovers.
+    """
+    cache = current_app.extensions["process_cache"]
+    key = (prompt, explicit_framework)
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+
+    entry = _process_prompt(prompt, explicit_framework)
+    if (entry[1]["generation_mode"] == "dynamic"
+            or not prompt_system.is_dynamic_available()):
+        cache.put(key, entry)
+    return entry
+
+
 # =============================================================================
 # ERROR HANDLERS
 # =============================================================================
@@ -220,11 +420,12 @@ def register_error_handlers(app):
         Occurs when a client exceeds their allowed request quota.
         Response includes retry information.
         """
-        app.logger.warning("Rate limit exceeded for %s", request.remote_addr)
-        return jsonify({
-            "error": "Rate limit exceeded. Please try again later.",
-            "retry_after": error.description,
-        }), 429
+        app.logger.warning("Rate limit exceeded for %s", _client_ip())
+        return Response(
+            _rate_limit_body(error.description),
+            status=429,
+            mimetype="application/json",
+        )
 
     @app.errorhandler(500)
     def handle_internal_error(error):
@@ -232,7 +433,8 @@ def register_error_handlers(app):
         Handle unexpected internal errors (500 Internal Server Error).
         
         Catches any unhandled exceptions to prevent exposing internal details.
-        Full stack trace is logged for debugging.
+        Full stack trace is logged for debugging. Route handlers rely on this
+        instead of wrapping their bodies in broad try/except blocks.
         """
         app.logger.exception("Internal server error: %s", error)
         return jsonify({"error": "Internal server error"}), 500
@@ -270,11 +472,7 @@ def register_routes(app, config):
         Returns:
             JSON: Service name, version, and status
         """
-        return jsonify({
-            "service": "CruxEn Prompt Optimization API",
-            "version": "2.0",
-            "status": "running",
-        })
+        return Response(app.config["_ROOT_JSON"], mimetype="application/json")
 
     @app.route("/health")
     def health_check():
@@ -290,10 +488,7 @@ def register_routes(app, config):
         Returns:
             JSON: Health status and feature availability
         """
-        return jsonify({
-            "status": "healthy",
-            "llm_available": llm_service is not None,
-        })
+        return Response(app.config["_HEALTH_JSON"], mimetype="application/json")
 
     # -------------------------------------------------------------------------
     # Framework Routes
@@ -313,12 +508,7 @@ def register_routes(app, config):
         Returns:
             JSON: Array of framework objects
         """
-        try:
-            frameworks = prompt_system.list_available_frameworks()
-            return jsonify(frameworks)
-        except Exception as e:
-            app.logger.exception("Failed to fetch frameworks: %s", e)
-            return jsonify({"error": "Failed to fetch frameworks"}), 500
+        return Response(app.config["_FRAMEWORKS_JSON"], mimetype="application/json")
 
     @app.route("/frameworks/<framework_id>", methods=["GET"])
     def get_framework_details(framework_id):
@@ -334,21 +524,13 @@ def register_routes(app, config):
         Example:
             GET /frameworks/coding_technical
         """
-        try:
-            # Validate and normalize the framework ID
-            framework_id = validate_framework_id(framework_id)
-            framework = prompt_system.get_framework_by_id(framework_id)
-            
-            if framework:
-                return jsonify(framework)
-            else:
-                return jsonify({"error": f'Framework "{framework_id}" not found'}), 404
-                
-        except ValidationError:
-            raise  # Let error handler deal with it
-        except Exception as e:
-            app.logger.exception("Failed to fetch framework details: %s", e)
-            return jsonify({"error": "Failed to fetch framework details"}), 500
+        # Validate and normalize the framework ID
+        framework_id = validate_framework_id(framework_id)
+        payload = app.config["_FRAMEWORK_BY_ID_JSON"].get(framework_id)
+
+        if payload is None:
+            return jsonify({"error": f'Framework "{framework_id}" not found'}), 404
+        return Response(payload, mimetype="application/json")
 
     # -------------------------------------------------------------------------
     # Optimization Routes
@@ -383,25 +565,20 @@ def register_routes(app, config):
         # Validate Content-Type header (must be application/json)
         validate_content_type()
 
-        # Validate and extract input data
-        data = request.get_json(silent=True)
-        prompt, explicit_framework = validate_prompt_input(
-            data,
+        # Parse and validate the request body in one pass
+        prompt, explicit_framework, _ = validate_prompt_request(
             max_length=config.MAX_PROMPT_LENGTH,
             min_length=config.MIN_PROMPT_LENGTH,
         )
 
         try:
-            # Process through the optimization system
-            opt_result = prompt_system.process(prompt, explicit_framework=explicit_framework)
-            return jsonify(opt_result)
-            
+            # Process through the optimization system (cached per input)
+            payload, _ = process_prompt(prompt, explicit_framework)
         except ValueError as ve:
             # Convert ValueError to ValidationError for consistent handling
             raise ValidationError(str(ve))
-        except Exception as e:
-            app.logger.exception("Prompt optimization failed: %s", e)
-            return jsonify({"error": "Prompt optimization failed"}), 500
+
+        return Response(payload, mimetype="application/json")
 
     @app.route("/chat", methods=["POST"])
     @limiter.limit(config.RATE_LIMIT_CHAT)  # e.g., "30 per minute"
@@ -437,7 +614,8 @@ def register_routes(app, config):
             {"prompt": "brainstorm startup ideas", "include_meta": true}
         """
         # Check if LLM service is available (requires API key)
-        if llm_service is None:
+        llm = get_llm_service()
+        if llm is None:
             return jsonify({
                 "error": "LLM service not configured. GROQ_API_KEY required."
             }), 503  # Service Unavailable
@@ -445,10 +623,8 @@ def register_routes(app, config):
         # Validate Content-Type header
         validate_content_type()
 
-        # Validate and extract input data
-        data = request.get_json(silent=True)
-        prompt, explicit_framework = validate_prompt_input(
-            data,
+        # Parse and validate the request body in one pass
+        prompt, explicit_framework, data = validate_prompt_request(
             max_length=config.MAX_PROMPT_LENGTH,
             min_length=config.MIN_PROMPT_LENGTH,
         )
@@ -456,46 +632,40 @@ def register_routes(app, config):
 
         # Step 1: Framework-based optimization
         try:
-            opt_result = prompt_system.process(prompt, explicit_framework=explicit_framework)
+            _, opt_result = process_prompt(prompt, explicit_framework)
         except ValueError as ve:
             raise ValidationError(str(ve))
-        except Exception as e:
-            app.logger.exception("Prompt optimization failed: %s", e)
-            return jsonify({"error": "Prompt optimization failed"}), 500
 
-        # Step 2: LLM enhancement
-        try:
-            llm_response = llm_service.optimize_prompt(
-                user_prompt=prompt,
-                framework_name=opt_result["framework"]["name"],
-                framework_desc=opt_result["framework"]["description"],
-                role_template=opt_result["framework"]["role"],
-                confidence=opt_result["confidence"],
-            )
-
-            # Build response
-            response_body = {
-                "optimized_prompt": llm_response.content,
+        # Bind the framework fields once; reused by the LLM call and metadata
+        framework = opt_result["framework"]
+        confidence = opt_result["confidence"]
+
+        # Step 2: LLM enhancement (LLMError is handled by the error handler)
+        llm_response = llm.optimize_prompt(
+            user_prompt=prompt,
+            framework_name=framework["name"],
+            framework_desc=framework["description"],
+            role_template=framework["role"],
+            confidence=confidence,
+        )
+
+        # Build response
+        response_body = {
+            "optimized_prompt": llm_response.content,
+        }
+
+        # Include metadata if requested (useful for debugging/analysis)
+        if include_meta:
+            response_body["metadata"] = {
+                "framework": framework,
+                "confidence": confidence,
+                "reasoning": opt_result["reasoning"],
+                "generation_mode": opt_result.get("generation_mode", "unknown"),
+                "llm_model": llm_response.model,
+                "usage": llm_response.usage,  # Token usage stats
             }
 
-            # Include metadata if requested (useful for debugging/analysis)
-            if include_meta:
-                response_body["metadata"] = {
-                    "framework": opt_result["framework"],
-                    "confidence": opt_result["confidence"],
-                    "reasoning": opt_result["reasoning"],
-                    "generation_mode": opt_result.get("generation_mode", "unknown"),
-                    "llm_model": llm_response.model,
-                    "usage": llm_response.usage,  # Token usage stats
-                }
-
-            return jsonify(response_body)
-
-        except LLMError:
-            raise  # Let error handler deal with it
-        except Exception as e:
-            app.logger.exception("LLM processing failed: %s", e)
-            return jsonify({"error": "LLM processing failed"}), 500
+        return jsonify(response_body)
 
 
 # =============================================================================
@@ -16,6 +16,7 @@ Configuration Classes:
 Environment Variables:
 ---------------------
 - FLASK_ENV: Environment name (development/production/testing)
+- DOTENV_SKIP: Set to skip loading .env (always skipped in production)
 - ALLOWED_ORIGINS: Comma-separated list of allowed CORS origins
 - GROQ_API_KEY: API key for Groq LLM service
 - GROQ_MODEL: LLM model to use (default: llama-3.3-70b-versatile)
@@ -23,8 +24,11 @@ Environment Variables:
 - RATE_LIMIT_DEFAULT: Default rate limit (e.g., "100 per hour")
 - RATE_LIMIT_CHAT: Rate limit for /chat endpoint
 - RATE_LIMIT_OPTIMIZE: Rate limit for /optimize endpoint
+- RATE_LIMIT_STORAGE_URI: Rate limit storage backend (e.g., "redis://host:6379/0")
 - MAX_PROMPT_LENGTH: Maximum allowed prompt length
 - MIN_PROMPT_LENGTH: Minimum required prompt length
+- PROCESS_CACHE_SIZE: Max cached optimization results (repeat prompts)
+- LOG_SAMPLE_RATE: Log 1 in N successful requests (default: 1, log all)
 
 Usage:
 ------
@@ -34,13 +38,62 @@ Usage:
 """
 
 import os
-from typing import List
-
-from dotenv import load_dotenv
+from functools import lru_cache
+from typing import Dict, FrozenSet, Optional
 
 # Load environment variables from .env file (if present)
-# This allows local development without setting system env vars
-load_dotenv()
+# This allows local development without setting system env vars.
+# Skipped in production (env is injected by the platform) or with
+# DOTENV_SKIP=1, which also avoids importing python-dotenv at all.
+if (
+    os.environ.get("FLASK_ENV", "development").lower() != "production"
+    and not os.environ.get("DOTENV_SKIP")
+):
+    try:
+        from dotenv import load_dotenv
+    except ImportError:  # python-dotenv is a development convenience
+        pass
+    else:
+        load_dotenv()
+
+
+# =============================================================================
+# ENVIRONMENT HELPERS
+# =============================================================================
+
+# Raw environment values already read (None = variable not set)
+_ENV_CACHE: Dict[str, Optional[str]] = {}
+
+
+def _env(key: str, default: Optional[str] = None) -> Optional[str]:
+    """
+    Read an environment variable once and serve repeats from _ENV_CACHE.
+    
+    The raw value is cached and the default applied per call, so two
+    classes may read the same key with different defaults. Environment is
+    treated as read-only after import; clear _ENV_CACHE to force a re-read.
+    """
+    try:
+        value = _ENV_CACHE[key]
+    except KeyError:
+        value = _ENV_CACHE[key] = os.environ.get(key)
+    return default if value is None else value
+
+
+def _env_int(key: str, default: int) -> int:
+    """Read an integer environment variable (cached via _env())."""
+    value = _env(key)
+    return default if value is None else int(value)
+
+
+def _parse_origins(raw: str) -> FrozenSet[str]:
+    """
+    Parse a comma-separated origins string into a frozenset.
+    
+    Whitespace around each origin is stripped and empty entries dropped,
+    in a single pass (e.g. "a.com, b.com," -> {"a.com", "b.com"}).
+    """
+    return frozenset(origin for origin in map(str.strip, raw.split(",")) if origin)
 
 
 # =============================================================================
@@ -66,30 +119,29 @@ class Config:
     # -------------------------------------------------------------------------
     # Allowed origins for cross-origin requests
     # Format in env: comma-separated URLs (e.g., "http://localhost:3000,https://app.example.com")
-    ALLOWED_ORIGINS: List[str] = [
-        origin.strip()
-        for origin in os.getenv(
+    # Stored as a frozenset: the CORS hook does one hash lookup per request
+    ALLOWED_ORIGINS: FrozenSet[str] = _parse_origins(
+        _env(
             "ALLOWED_ORIGINS",
             "http://localhost:3000,https://crux-en.vercel.app"  # Default origins
-        ).split(",")
-        if origin.strip()  # Filter out empty strings
-    ]
+        )
+    )
 
     # -------------------------------------------------------------------------
     # Groq LLM API Settings
     # -------------------------------------------------------------------------
     # API key for authentication (required for /chat endpoint)
-    GROQ_API_KEY = os.getenv("GROQ_API_KEY")
+    GROQ_API_KEY = _env("GROQ_API_KEY")
     
     # Groq API endpoint (OpenAI-compatible)
     GROQ_API_URL = "https://api.groq.com/openai/v1/chat/completions"
     
     # LLM model to use (Groq supports various models)
     # Options: llama-3.3-70b-versatile, mixtral-8x7b-32768, etc.
-    GROQ_MODEL = os.getenv("GROQ_MODEL", "llama-3.3-70b-versatile")
+    GROQ_MODEL = _env("GROQ_MODEL", "llama-3.3-70b-versatile")
     
     # Request timeout in seconds (prevents hanging requests)
-    GROQ_TIMEOUT = int(os.getenv("GROQ_TIMEOUT", "30"))
+    GROQ_TIMEOUT = _env_int("GROQ_TIMEOUT", 30)
 
     # -------------------------------------------------------------------------
     # Rate Limiting Settings
@@ -98,22 +150,45 @@ class Config:
     # Supported periods: second, minute, hour, day
     
     # Default limit for all endpoints
-    RATE_LIMIT_DEFAULT = os.getenv("RATE_LIMIT_DEFAULT", "100 per hour")
+    RATE_LIMIT_DEFAULT = _env("RATE_LIMIT_DEFAULT", "100 per hour")
     
     # Stricter limit for /chat (due to LLM API costs)
-    RATE_LIMIT_CHAT = os.getenv("RATE_LIMIT_CHAT", "30 per minute")
+    RATE_LIMIT_CHAT = _env("RATE_LIMIT_CHAT", "30 per minute")
     
     # Moderate limit for /optimize (local processing only)
-    RATE_LIMIT_OPTIMIZE = os.getenv("RATE_LIMIT_OPTIMIZE", "60 per minute")
+    RATE_LIMIT_OPTIMIZE = _env("RATE_LIMIT_OPTIMIZE", "60 per minute")
+
+    # Storage backend for rate limit counters
+    # "memory://" is per-process: with N gunicorn workers each client gets N x
+    # the quota. Point this at Redis in production so all workers share state.
+    RATE_LIMIT_STORAGE_URI = _env("RATE_LIMIT_STORAGE_URI", "memory://")
+
+    # Rolling window strategy (atomic Lua script per check on Redis)
+    RATE_LIMIT_STRATEGY = _env("RATE_LIMIT_STRATEGY", "moving-window")
 
     # -------------------------------------------------------------------------
     # Input Validation Settings
     # -------------------------------------------------------------------------
     # Maximum characters allowed in a prompt
-    MAX_PROMPT_LENGTH = int(os.getenv("MAX_PROMPT_LENGTH", "10000"))
+    MAX_PROMPT_LENGTH = _env_int("MAX_PROMPT_LENGTH", 10000)
     
     # Minimum characters required (prevents empty/trivial prompts)
-    MIN_PROMPT_LENGTH = int(os.getenv("MIN_PROMPT_LENGTH", "3"))
+    MIN_PROMPT_LENGTH = _env_int("MIN_PROMPT_LENGTH", 3)
+
+    # -------------------------------------------------------------------------
+    # Logging Settings
+    # -------------------------------------------------------------------------
+    # Log 1 in N successful requests (start/completion lines); 1 = log all
+    # Requests answered with a 4xx/5xx status are always logged on completion
+    LOG_SAMPLE_RATE = max(1, _env_int("LOG_SAMPLE_RATE", 1))
+
+    # -------------------------------------------------------------------------
+    # Caching Settings
+    # -------------------------------------------------------------------------
+    # Number of (prompt, framework) optimization results kept in the LRU cache.
+    # Entries hold the serialized payload and result dict (~40 KB each), so
+    # the default caps the cache at roughly 10 MB per worker
+    PROCESS_CACHE_SIZE = _env_int("PROCESS_CACHE_SIZE", 256)
 
 
 # =============================================================================
@@ -134,12 +209,12 @@ class DevelopmentConfig(Config):
     
     # Allow all common localhost variations for development
     # Plus production URL for testing CORS locally
-    ALLOWED_ORIGINS = [
+    ALLOWED_ORIGINS = frozenset((
         "http://localhost:3000",    # Next.js default
         "http://127.0.0.1:3000",    # Alternative localhost
         "http://localhost:5000",    # Flask default
         "https://crux-en.vercel.app",  # Production frontend (for local testing)
-    ]
+    ))
 
 
 # =============================================================================
@@ -160,14 +235,12 @@ class ProductionConfig(Config):
     
     # Only allow production origins (loaded from env)
     # Set ALLOWED_ORIGINS env var in production deployment
-    ALLOWED_ORIGINS = [
-        origin.strip()
-        for origin in os.getenv(
+    ALLOWED_ORIGINS = _parse_origins(
+        _env(
             "ALLOWED_ORIGINS",
             "https://crux-en.vercel.app"  # Production frontend URL
-        ).split(",")
-        if origin.strip()
-    ]
+        )
+    )
 
 
 # =============================================================================
@@ -188,25 +261,32 @@ class TestingConfig(Config):
     DEBUG = True     # Verbose output for test debugging
     
     # Test origins
-    ALLOWED_ORIGINS = ["http://localhost:3000", "http://testserver"]
+    ALLOWED_ORIGINS = frozenset(("http://localhost:3000", "http://testserver"))
     
     # Mock API key (tests should mock the actual API calls)
     GROQ_API_KEY = "test-api-key"
-    
+
     # Relaxed rate limits for test speed
     RATE_LIMIT_DEFAULT = "1000 per hour"
     RATE_LIMIT_CHAT = "1000 per minute"
     RATE_LIMIT_OPTIMIZE = "1000 per minute"
 
+    # Always use local storage in tests (no Redis dependency)
+    RATE_LIMIT_STORAGE_URI = "memory://"
+
 
 # =============================================================================
 # CONFIGURATION FACTORY
 # =============================================================================
 
+@lru_cache(maxsize=None)
 def get_config():
     """
     Get the appropriate configuration based on FLASK_ENV environment variable.
     
+    The config object is built once and reused process-wide. Call
+    get_config.cache_clear() after changing FLASK_ENV (e.g. in tests).
+    
     Environment Detection:
     - FLASK_ENV=development -> DevelopmentConfig
     - FLASK_ENV=production  -> ProductionConfig
@@ -214,7 +294,7 @@ def get_config():
     - (default)             -> DevelopmentConfig
     
     Returns:
-        Config: Instantiated configuration object
+        Config: Instantiated configuration object (shared, treat as read-only)
     
     Example:
         config = get_config()
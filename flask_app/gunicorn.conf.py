@@ -0,0 +1,61 @@
+"""
+Gunicorn Configuration
+======================
+
+Loaded automatically when gunicorn is started from this directory:
+
+    gunicorn app:app --bind 0.0.0.0:$PORT
+
+Worker Model:
+-------------
+The /chat endpoint spends almost all of its time waiting on the Groq API.
+With the default sync worker, one slow LLM call occupies the whole worker
+and /health or /frameworks requests queue behind it. Threaded workers
+(gthread) release the GIL during network I/O, so each worker can keep
+many LLM calls in flight while still answering cheap endpoints.
+
+CPU-bound work (framework classification, structuring, JSON encoding)
+still holds the GIL, so it scales across cores with worker processes.
+Rate limit counters in "memory://" storage are per-process, so a single
+worker is started unless WEB_CONCURRENCY is set or RATE_LIMIT_STORAGE_URI
+points at shared storage (Redis), in which case one worker per CPU is used.
+
+Environment Variables:
+---------------------
+- WEB_CONCURRENCY: Worker processes (default: CPU count with shared
+  rate limit storage, otherwise 1)
+- GUNICORN_THREADS: Threads per worker (default: 8)
+- GUNICORN_TIMEOUT: Worker timeout in seconds (default: 60)
+"""
+
+import os
+
+# -----------------------------------------------------------------------------
+# Worker Settings
+# -----------------------------------------------------------------------------
+_storage_uri = os.getenv("RATE_LIMIT_STORAGE_URI", "").strip() or "memory://"
+_memory_storage = _storage_uri.startswith("memory://")
+
+workers = int(os.getenv(
+    "WEB_CONCURRENCY", "1" if _memory_storage else str(os.cpu_count() or 1)
+))
+worker_class = "gthread"
+threads = int(os.getenv("GUNICORN_THREADS", "8"))
+
+# Must exceed the LLM read timeout (GROQ_TIMEOUT, default 30s); read timeouts
+# are not retried, only fast connect errors and 502/503/504 responses
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "60"))
+
+# Keep client connections open between requests (load balancer keep-alive)
+keepalive = 5
+
+
+def when_ready(server):
+    """Warn when per-process rate limit storage is split across workers."""
+    if workers > 1 and _memory_storage:
+        server.log.warning(
+            "%d workers with memory:// rate limit storage: each worker keeps "
+            "its own counters, so clients get %dx the configured quota. "
+            "Set RATE_LIMIT_STORAGE_URI to shared storage (e.g. Redis).",
+            workers, workers,
+        )
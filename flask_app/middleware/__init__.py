@@ -10,7 +10,8 @@ Available Components:
 
 Logging:
     - setup_logging: Configure structured logging with request IDs
-    - RequestLoggingMiddleware: Automatic request/response logging
+    - init_request_logging: Automatic request/response logging
+    - RequestLoggingMiddleware: Class wrapper for init_request_logging
 
 Validation:
     - validate_prompt_input: Validate POST body for prompt endpoints
@@ -29,14 +30,14 @@ Usage:
 ------
     from middleware import (
         setup_logging,
-        RequestLoggingMiddleware,
+        init_request_logging,
         validate_prompt_input,
         ValidationError,
     )
     
     # Setup logging
     setup_logging(app, level=logging.INFO)
-    RequestLoggingMiddleware(app)
+    init_request_logging(app)
     
     # Validate input
     try:
@@ -45,13 +46,18 @@ Usage:
         return jsonify(e.to_dict()), e.status_code
 """
 
-from .logging_middleware import setup_logging, RequestLoggingMiddleware
+from .logging_middleware import (
+    setup_logging,
+    init_request_logging,
+    RequestLoggingMiddleware,
+)
 from .validation import validate_prompt_input, ValidationError
 
 # Public API
 __all__ = [
     # Logging
     "setup_logging",
+    "init_request_logging",
     "RequestLoggingMiddleware",
     # Validation
     "validate_prompt_input",
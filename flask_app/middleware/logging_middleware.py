@@ -12,6 +12,7 @@ Features:
 - Structured log format with timestamps
 - Request ID propagation via X-Request-ID header
 - Response timing header (X-Response-Time)
+- Non-blocking handlers (records are queued; a background thread writes them)
 
 Log Format:
 -----------
@@ -21,29 +22,34 @@ Log Format:
 Classes:
 --------
 - RequestIdFilter: Adds request_id to log records
-- RequestLoggingMiddleware: Registers before/after request hooks
+- RequestLoggingMiddleware: Class wrapper for init_request_logging()
 
 Functions:
 ----------
 - setup_logging(): Configure structured logging for the app
+- init_request_logging(): Register before/after request hooks
 - log_endpoint(): Decorator for additional endpoint logging
 
 Usage:
 ------
-    from middleware.logging_middleware import setup_logging, RequestLoggingMiddleware
+    from middleware.logging_middleware import setup_logging, init_request_logging
     
     app = Flask(__name__)
     setup_logging(app, level=logging.INFO)
-    RequestLoggingMiddleware(app)
+    init_request_logging(app)
 """
 
+import atexit
+import itertools
 import logging
+import logging.handlers
+import os
+import queue
 import time
-import uuid
 from functools import wraps
-from typing import Callable
+from typing import Callable, Optional
 
-from flask import Flask, g, request
+from flask import Flask, g, has_app_context, request
 
 
 # =============================================================================
@@ -78,15 +84,47 @@ class RequestIdFilter(logging.Filter):
         Returns:
             bool: Always True (never filters out records)
         """
-        try:
-            # Try to get request_id from Flask's g object
-            record.request_id = getattr(g, "request_id", "no-request")
-        except RuntimeError:
-            # Outside of application/request context (e.g., during startup or tests)
+        # g lives on the app context; check for one instead of catching the
+        # RuntimeError raised outside it (e.g., during startup or tests)
+        if has_app_context():
+            record.request_id = g.get("request_id", "no-request")
+        else:
             record.request_id = "no-context"
         return True
 
 
+# =============================================================================
+# QUEUE HANDLER
+# =============================================================================
+
+class _InProcessQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that enqueues records as-is.
+    
+    The default prepare() formats the message and strips args/exc_info so
+    the record can be pickled for another process. Our listener runs in the
+    same process, so that work is skipped and left to the listener thread.
+    """
+
+    def prepare(self, record):
+        return record
+
+
+# Background listener that formats and writes queued records
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_listener() -> None:
+    """Flush pending records and stop the background listener (if any)."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(_stop_listener)
+
+
 # =============================================================================
 # LOGGING SETUP
 # =============================================================================
@@ -99,11 +137,17 @@ def setup_logging(app: Flask, level: int = logging.INFO) -> None:
     - Custom format including timestamp, level, and request ID
     - Request ID filter for traceability
     - Configurable log level
+    - A queue in front of the console handler
     
     The logging is configured for both:
-    - Flask's app.logger (for application logs)
+    - Flask's app.logger (for application logs, propagated to root)
     - Root logger (for library/service logs)
     
+    Request threads only tag the record with its request ID and put it on
+    a queue; formatting and writing to the console happen on a background
+    QueueListener thread, off the request path. Calling this again (e.g.
+    one app per test) replaces the previous listener.
+    
     Args:
         app: Flask application instance
         level: Logging level (default: logging.INFO)
@@ -119,14 +163,20 @@ def setup_logging(app: Flask, level: int = logging.INFO) -> None:
         app.logger.info("Server started")
         # Output: [2024-01-15 10:30:45] [INFO] [no-context] Server started
     """
+    global _listener
+
     # -------------------------------------------------------------------------
     # Clear existing handlers to prevent duplicate logs
     # -------------------------------------------------------------------------
+    # app.logger has no handler of its own; records propagate to root
     app.logger.handlers = []
+    app.logger.setLevel(level)
+    _stop_listener()
 
     # -------------------------------------------------------------------------
     # Create and configure stream handler (console output)
     # -------------------------------------------------------------------------
+    # Runs on the listener thread, never on a request thread
     handler = logging.StreamHandler()
     handler.setLevel(level)
 
@@ -137,126 +187,130 @@ def setup_logging(app: Flask, level: int = logging.INFO) -> None:
         datefmt="%Y-%m-%d %H:%M:%S",
     )
     handler.setFormatter(formatter)
-    
-    # Add filter to inject request_id into log records
-    handler.addFilter(RequestIdFilter())
-
-    # Apply to Flask's app logger
-    app.logger.addHandler(handler)
-    app.logger.setLevel(level)
 
     # -------------------------------------------------------------------------
     # Configure root logger for service modules
     # -------------------------------------------------------------------------
     # This ensures logs from services (like LLMService) also get formatted
+    queue_handler = _InProcessQueueHandler(queue.SimpleQueue())
+    queue_handler.setLevel(level)
+
+    # The filter reads Flask's g, so it must run on the request thread
+    queue_handler.addFilter(RequestIdFilter())
+
     root_logger = logging.getLogger()
-    root_logger.handlers = []  # Clear existing handlers
-    
-    # Create separate handler for root logger
-    root_handler = logging.StreamHandler()
-    root_handler.setFormatter(formatter)
-    root_handler.addFilter(RequestIdFilter())
-    
-    root_logger.addHandler(root_handler)
+    root_logger.handlers = [queue_handler]  # Clear existing handlers
     root_logger.setLevel(level)
 
+    _listener = logging.handlers.QueueListener(
+        queue_handler.queue, handler, respect_handler_level=True
+    )
+    _listener.start()
+
 
 # =============================================================================
 # REQUEST LOGGING MIDDLEWARE
 # =============================================================================
 
-class RequestLoggingMiddleware:
+def init_request_logging(app: Flask) -> None:
     """
-    Middleware for automatic request logging with timing and request IDs.
+    Register automatic request logging with timing and request IDs.
+    
+    This registers hooks that:
+    1. Assign a unique ID to each request (or use provided X-Request-ID)
+    2. Log when requests start and complete
+    3. Track request duration
+    4. Add timing headers to responses
     
-    This middleware:
-    1. Assigns a unique ID to each request (or uses provided X-Request-ID)
-    2. Logs when requests start and complete
-    3. Tracks request duration
-    4. Adds timing headers to responses
+    The logger methods are bound into the hook closures once, so the
+    per-request path reads locals instead of walking app.logger.
+    
+    With app.config["LOG_SAMPLE_RATE"] = N (> 1), only every Nth request
+    logs its start/completion lines; error responses (status >= 400) are
+    always logged on completion. Headers are added to every response.
     
     Response Headers Added:
         X-Request-ID: The unique request identifier
         X-Response-Time: How long the request took (e.g., "125.5ms")
     
+    Args:
+        app: Flask application instance
+    
     Usage:
         app = Flask(__name__)
-        RequestLoggingMiddleware(app)
+        init_request_logging(app)
     
     Example logs:
         [2024-01-15 10:30:45] [INFO] [abc12345] Request started: POST /optimize
         [2024-01-15 10:30:45] [INFO] [abc12345] Request completed: POST /optimize - 200 (125.5ms)
     """
+    # Bound once; the hooks skip the logging call entirely when INFO is
+    # disabled (e.g. level raised to WARNING in production)
+    log_info = app.logger.info
+    is_enabled_for = app.logger.isEnabledFor
 
-    def __init__(self, app: Flask) -> None:
-        """
-        Initialize middleware and register hooks.
-        
-        Args:
-            app: Flask application instance
-        """
-        self.app = app
-        self._register_hooks()
+    # Request sampling (1 = log every request)
+    sample_rate = app.config.get("LOG_SAMPLE_RATE", 1)
+    request_counter = itertools.count()
 
-    def _register_hooks(self) -> None:
+    @app.before_request
+    def before_request():
         """
-        Register before_request and after_request hooks.
+        Set up request context before processing.
+        
+        This hook runs before every request and:
+        1. Generates or extracts request ID
+        2. Records start time for duration calculation
+        3. Logs the request start
         
-        These hooks intercept every request to:
-        - Set up request context (before)
-        - Log completion and add headers (after)
+        Request ID Sources (in order of preference):
+        1. X-Request-ID header (if provided by client/proxy)
+        2. Auto-generated 8 hex chars (4 random bytes)
         """
-
-        @self.app.before_request
-        def before_request():
-            """
-            Set up request context before processing.
-            
-            This hook runs before every request and:
-            1. Generates or extracts request ID
-            2. Records start time for duration calculation
-            3. Logs the request start
-            
-            Request ID Sources (in order of preference):
-            1. X-Request-ID header (if provided by client/proxy)
-            2. Auto-generated UUID (truncated to 8 chars for readability)
-            """
-            # Get or generate request ID
-            # Using first 8 chars of UUID for readability in logs
-            g.request_id = request.headers.get("X-Request-ID", str(uuid.uuid4())[:8])
-            
-            # Record start time for duration calculation
-            g.start_time = time.time()
-
-            # Log request start
-            self.app.logger.info(
+        # Get or generate request ID
+        # 8 hex chars for readability in logs (same as a truncated UUID,
+        # without building the UUID object and its 36-char string)
+        request_id = request.headers.get("X-Request-ID")
+        g.request_id = request_id if request_id is not None else os.urandom(4).hex()
+        
+        # Record start time for duration calculation
+        # (monotonic clock: immune to NTP/wall-clock adjustments)
+        g.start_time = time.perf_counter()
+
+        # Log request start (sampled)
+        g.log_request = sample_rate == 1 or next(request_counter) % sample_rate == 0
+        if g.log_request and is_enabled_for(logging.INFO):
+            log_info(
                 "Request started: %s %s",
                 request.method,
                 request.path,
             )
 
-        @self.app.after_request
-        def after_request(response):
-            """
-            Log completion and add headers after processing.
-            
-            This hook runs after every request and:
-            1. Calculates request duration
-            2. Logs completion with status and timing
-            3. Adds tracking headers to response
-            
-            Args:
-                response: Flask Response object
-            
-            Returns:
-                Response: Modified response with added headers
-            """
-            # Calculate request duration
-            duration = time.time() - getattr(g, "start_time", time.time())
-            duration_ms = round(duration * 1000, 2)  # Convert to milliseconds
-
-            # Log request completion
-            self.app.logger.info(
+    @app.after_request
+    def after_request(response):
+        """
+        Log completion and add headers after processing.
+        
+        This hook runs after every request and:
+        1. Calculates request duration
+        2. Logs completion with status and timing
+        3. Adds tracking headers to response
+        
+        Args:
+            response: Flask Response object
+        
+        Returns:
+            Response: Modified response with added headers
+        """
+        # Calculate request duration
+        now = time.perf_counter()
+        duration = now - getattr(g, "start_time", now)
+        duration_ms = f"{duration * 1000:.2f}"  # Milliseconds, formatted once
+
+        # Log request completion (sampled; errors always logged)
+        log_request = g.get("log_request", True) or response.status_code >= 400
+        if log_request and is_enabled_for(logging.INFO):
+            log_info(
                 "Request completed: %s %s - %s (%sms)",
                 request.method,
                 request.path,
@@ -264,12 +318,35 @@ class RequestLoggingMiddleware:
                 duration_ms,
             )
 
-            # Add tracking headers to response
-            # These are useful for debugging and client-side tracking
-            response.headers["X-Request-ID"] = getattr(g, "request_id", "unknown")
-            response.headers["X-Response-Time"] = f"{duration_ms}ms"
+        # Add tracking headers to response
+        # These are useful for debugging and client-side tracking
+        # (appended in one call; handlers never set these themselves)
+        response.headers.extend((
+            ("X-Request-ID", g.get("request_id", "unknown")),
+            ("X-Response-Time", duration_ms + "ms"),
+        ))
 
-            return response
+        return response
+
+
+class RequestLoggingMiddleware:
+    """
+    Backward-compatible wrapper around init_request_logging().
+    
+    Usage:
+        app = Flask(__name__)
+        RequestLoggingMiddleware(app)
+    """
+
+    def __init__(self, app: Flask) -> None:
+        """
+        Register the request logging hooks on the app.
+        
+        Args:
+            app: Flask application instance
+        """
+        self.app = app
+        init_request_logging(app)
 
 
 # =============================================================================
@@ -305,16 +382,24 @@ def log_endpoint(func: Callable) -> Callable:
         [ERROR] Endpoint process_data failed: ValueError: ...
     """
 
+    # Resolved once at decoration time; INFO lines are skipped without
+    # entering the logging pipeline when the level is above INFO
+    root_logger = logging.getLogger()
+    is_enabled_for = root_logger.isEnabledFor
+    name = func.__name__
+
     @wraps(func)  # Preserve original function metadata
     def wrapper(*args, **kwargs):
-        logging.info("Entering endpoint: %s", func.__name__)
+        if is_enabled_for(logging.INFO):
+            root_logger.info("Entering endpoint: %s", name)
         try:
             result = func(*args, **kwargs)
-            logging.info("Endpoint %s completed successfully", func.__name__)
-            return result
         except Exception as e:
             # Log the exception with full stack trace
-            logging.exception("Endpoint %s failed: %s", func.__name__, str(e))
+            root_logger.exception("Endpoint %s failed: %s", name, str(e))
             raise  # Re-raise to let Flask's error handlers deal with it
+        if is_enabled_for(logging.INFO):
+            root_logger.info("Endpoint %s completed successfully", name)
+        return result
 
     return wrapper
@@ -18,6 +18,7 @@ Classes:
 Functions:
 ----------
 - validate_prompt_input(): Validate POST body for prompt endpoints
+- validate_prompt_request(): Parse the raw request body and validate it
 - validate_content_type(): Ensure correct Content-Type header
 - validate_framework_id(): Validate framework ID URL parameters
 
@@ -39,12 +40,39 @@ Usage:
         return jsonify(e.to_dict()), e.status_code
 """
 
+import json
 import re
 from typing import Any, Dict, Optional, Tuple
 
+import orjson
 from flask import request
 
 
+# Framework IDs: lowercase ASCII letters and underscores (e.g., "coding_technical")
+# Compiled once at import; fullmatch() replaces the ^...$ anchors
+_FRAMEWORK_ID_RE = re.compile(r"[a-z_]+", re.ASCII)
+_MAX_FRAMEWORK_ID_LENGTH = 50
+
+# Methods whose request body must be JSON
+_BODY_METHODS = frozenset(("POST", "PUT", "PATCH"))
+_JSON_MEDIA_TYPE = "application/json"
+
+# Suspicious literal patterns, combined into one case-insensitive regex so a
+# prompt is scanned once, without building a lowercased copy:
+#   <script\b       HTML script tags (XSS)
+#   javascript:     JavaScript URLs
+#   data:text/html  Data URLs with HTML content
+# Every literal contains "<" or ":", which gate the regex (see below)
+_SUSPICIOUS_RE = re.compile(
+    r"<script\b|javascript:|data:text/html",
+    re.IGNORECASE,
+)
+
+# Template/expression injection: a closer counts only if it follows its
+# opener within this many characters and before the next opener
+_INJECTION_MAX_SPAN = 256
+
+
 # =============================================================================
 # CUSTOM EXCEPTION
 # =============================================================================
@@ -196,7 +224,7 @@ def validate_prompt_input(
 
         # Format validation - only allow valid framework ID characters
         # Valid format: lowercase letters and underscores (e.g., "coding_technical")
-        if not re.match(r"^[a-z_]+$", framework):
+        if _FRAMEWORK_ID_RE.fullmatch(framework) is None:
             raise ValidationError(
                 "Framework must contain only lowercase letters and underscores",
                 field="framework",
@@ -205,6 +233,54 @@ def validate_prompt_input(
     return prompt, framework
 
 
+def validate_prompt_request(
+    max_length: int = 10000,
+    min_length: int = 3,
+) -> Tuple[str, Optional[str], Dict[str, Any]]:
+    """
+    Parse the current request body and validate it as prompt input.
+    
+    The raw body is read once and parsed with orjson, replacing the
+    request.get_json() + validate_prompt_input() pair in the handlers.
+    Malformed or empty bodies are reported the same way as before
+    ("Request body must be JSON"). Like get_json(), UTF-16 and UTF-32
+    bodies are detected and decoded; orjson itself only reads UTF-8.
+    
+    Args:
+        max_length: Maximum allowed prompt length (default: 10000)
+        min_length: Minimum required prompt length (default: 3)
+    
+    Returns:
+        Tuple[str, Optional[str], Dict[str, Any]]:
+            (validated_prompt, validated_framework, parsed_body)
+    
+    Raises:
+        ValidationError: On any validation failure
+    
+    Example:
+        prompt, framework, data = validate_prompt_request(max_length=5000)
+        include_meta = bool(data.get("include_meta", False))
+    """
+    body = request.get_data(cache=False)
+    try:
+        if body:
+            # Same detection as json.loads(bytes); the common UTF-8 case
+            # goes straight to orjson without decoding
+            encoding = json.detect_encoding(body)
+            if encoding != "utf-8":
+                body = body.decode(encoding, "surrogatepass")
+            data = orjson.loads(body)
+        else:
+            data = None
+    except (orjson.JSONDecodeError, UnicodeDecodeError):
+        data = None
+
+    prompt, framework = validate_prompt_input(
+        data, max_length=max_length, min_length=min_length
+    )
+    return prompt, framework, data
+
+
 # =============================================================================
 # SECURITY VALIDATION
 # =============================================================================
@@ -228,21 +304,36 @@ def _contains_suspicious_patterns(text: str) -> bool:
     Returns:
         bool: True if suspicious patterns found, False otherwise
     """
-    # List of regex patterns to check for
-    suspicious_patterns = [
-        r"<script\b",       # HTML script tags (XSS)
-        r"javascript:",     # JavaScript URLs
-        r"data:text/html",  # Data URLs with HTML content
-        r"\{\{.*\}\}",      # Template injection (e.g., Jinja2: {{ code }})
-        r"\$\{.*\}",        # Expression injection (e.g., ${code})
-    ]
-
-    # Check each pattern against lowercase text
-    text_lower = text.lower()
-    for pattern in suspicious_patterns:
-        if re.search(pattern, text_lower):
-            return True
+    # Template injection (e.g., Jinja2: {{ code }}) and expression injection
+    # (e.g., ${code}), spanning lines if need be
+    if _has_nearby_pair(text, "{{", "}}") or _has_nearby_pair(text, "${", "}"):
+        return True
+
+    # Literal patterns: skip the regex when neither "<" nor ":" occurs
+    if "<" not in text and ":" not in text:
+        return False
+    return _SUSPICIOUS_RE.search(text) is not None
 
+
+def _has_nearby_pair(text: str, opener: str, closer: str) -> bool:
+    """
+    Check whether an opener is closed within _INJECTION_MAX_SPAN characters.
+    
+    The closer must also precede the next opener, so "{{" early in a prompt
+    and an unrelated "}}" far later are not paired. Each search is bounded
+    by the next opener, keeping the scan linear where {{.*}} backtracks
+    quadratically on input like "{{{{{{..." with no closing braces.
+    """
+    start = text.find(opener)
+    while start != -1:
+        begin = start + len(opener)
+        end = begin + _INJECTION_MAX_SPAN
+        next_start = text.find(opener, begin, end)
+        if next_start != -1:
+            end = next_start
+        if text.find(closer, begin, end) != -1:
+            return True
+        start = next_start if next_start != -1 else text.find(opener, end)
     return False
 
 
@@ -269,11 +360,15 @@ def validate_content_type() -> None:
             data = request.get_json()
             ...
     """
-    content_type = request.content_type or ""
-
     # Only check for methods that have request bodies
-    if request.method in ("POST", "PUT", "PATCH"):
-        if "application/json" not in content_type:
+    if request.method in _BODY_METHODS:
+        # Media type must lead the header, optionally followed by parameters
+        # (e.g. "application/json; charset=utf-8")
+        content_type = request.content_type or ""
+        if not content_type.startswith(_JSON_MEDIA_TYPE) or (
+            len(content_type) > len(_JSON_MEDIA_TYPE)
+            and content_type[len(_JSON_MEDIA_TYPE)] not in "; \t"
+        ):
             raise ValidationError(
                 "Content-Type must be application/json",
                 status_code=415,  # Unsupported Media Type
@@ -313,14 +408,14 @@ def validate_framework_id(framework_id: str) -> str:
     # Normalize: strip whitespace and convert to lowercase
     framework_id = framework_id.strip().lower()
 
+    # Length limit to prevent abuse (checked first - cheapest rejection)
+    if len(framework_id) > _MAX_FRAMEWORK_ID_LENGTH:
+        raise ValidationError("Framework ID is too long")
+
     # Format validation - must match expected pattern
-    if not re.match(r"^[a-z_]+$", framework_id):
+    if _FRAMEWORK_ID_RE.fullmatch(framework_id) is None:
         raise ValidationError(
             "Framework ID must contain only lowercase letters and underscores"
         )
 
-    # Length limit to prevent abuse
-    if len(framework_id) > 50:
-        raise ValidationError("Framework ID is too long")
-
     return framework_id
@@ -28,19 +28,27 @@ Architecture:
 
 import re
 import os
+import importlib.util
 import logging
-from typing import Dict, List, Tuple, Optional, Any
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, List, Tuple, Optional, Any, Sequence
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from abc import ABC, abstractmethod
 
-logger = logging.getLogger(__name__)
+import orjson
 
-try:
+if TYPE_CHECKING:
     import requests
-    REQUESTS_AVAILABLE = True
-except ImportError:
-    REQUESTS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# requests is only needed for LLM calls; it is imported on first use (see
+# GroqProvider._get_session) so the static/CLI path skips its import cost
+REQUESTS_AVAILABLE = importlib.util.find_spec("requests") is not None
 
 
 # =============================================================================
@@ -76,6 +84,24 @@ FORBIDDEN_WORDS = [
 ]
 
 
+# All forbidden words as one case-insensitive, word-bounded alternation
+_FORBIDDEN_RE = re.compile(
+    r"\b(?:" + "|".join(map(re.escape, FORBIDDEN_WORDS)) + r")\b",
+    re.IGNORECASE,
+)
+_FORBIDDEN_MAX_LEN = max(map(len, FORBIDDEN_WORDS))
+
+
+# Filler and hedging phrases stripped from user input, as one case-insensitive
+# alternation so input is scanned once (order matters: "kindly" before "kind of")
+_FILLER_RE = re.compile(
+    r"\b(?:please|kindly|could you|can you|i want to|i need to|i would like to"
+    r"|maybe|possibly|perhaps|something like|sort of|kind of"
+    r"|basically|actually|honestly|literally)\b",
+    re.IGNORECASE,
+)
+
+
 MANDATORY_SECTIONS = [
     "ROLE",
     "PLATFORM",
@@ -87,27 +113,27 @@ MANDATORY_SECTIONS = [
 ]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FrameworkSpec:
     """Framework specification with targets and constraints."""
     framework: Framework
     name: str
     description: str
-    targets: List[str]
-    enforcements: List[str]
-    avoidances: List[str]
-    triggers: List[str]
-    ideal_for: List[str]
+    targets: Tuple[str, ...]
+    enforcements: Tuple[str, ...]
+    avoidances: Tuple[str, ...]
+    triggers: Tuple[str, ...]  # Ordered: first five are shown as example inputs
+    ideal_for: Tuple[str, ...]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OptimizedPrompt:
     """Result of prompt optimization."""
     framework: Framework
     framework_name: str
     prompt: str
     valid: bool
-    violations: List[str]
+    violations: Tuple[str, ...]
     confidence: float
     generation_mode: str = "static"
 
@@ -119,7 +145,10 @@ class OptimizedPrompt:
 
 class LLMProvider(ABC):
     @abstractmethod
-    def generate(self, system_prompt: str, user_input: str, **kwargs) -> Optional[str]:
+    def generate(
+        self, system_prompt: str, user_input: str, **kwargs
+    ) -> Optional[Tuple[str, bool]]:
+        """Return (text, aborted), or None on failure."""
         pass
     
     @property
@@ -135,8 +164,31 @@ class GroqProvider(LLMProvider):
     MODEL = "llama-3.3-70b-versatile"
     TIMEOUT = 45
     
+    # Keep-alive session shared by all providers, created on first request.
+    # No transport-level retries: PromptOptimizer already retries generation.
+    _session = None
+    _session_lock = threading.Lock()
+    
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key or os.environ.get("GROQ_API_KEY")
+        self._headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
+    
+    @classmethod
+    def _get_session(cls) -> "requests.Session":
+        """Return the shared pooled session (reuses TCP/TLS connections)."""
+        if cls._session is None:
+            with cls._session_lock:
+                if cls._session is None:
+                    import requests
+                    from requests.adapters import HTTPAdapter
+                    
+                    session = requests.Session()
+                    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=32))
+                    cls._session = session
+        return cls._session
     
     @property
     def is_available(self) -> bool:
@@ -148,38 +200,85 @@ class GroqProvider(LLMProvider):
         user_input: str,
         temperature: float = 0.3,
         max_tokens: int = 1200,
-    ) -> Optional[str]:
+        abort_pattern: Optional["re.Pattern[str]"] = None,
+    ) -> Optional[Tuple[str, bool]]:
+        """
+        Request a completion; returns (text, aborted) or None on failure.
+        
+        With abort_pattern, the completion is streamed and the connection
+        closed at the first match; the partial text is returned with
+        aborted=True so the caller can reject it without waiting for the
+        remaining tokens.
+        """
         if not self.is_available:
             return None
         
+        stream = abort_pattern is not None
+        payload: Dict[str, Any] = {
+            "model": self.MODEL,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_input},
+            ],
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        }
+        if stream:
+            payload["stream"] = True
+        
         try:
-            response = requests.post(
+            response = self._get_session().post(
                 self.API_URL,
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "model": self.MODEL,
-                    "messages": [
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_input},
-                    ],
-                    "temperature": temperature,
-                    "max_tokens": max_tokens,
-                },
+                headers=self._headers,
+                data=orjson.dumps(payload),
+                stream=stream,
                 timeout=self.TIMEOUT,
             )
             
-            if response.status_code == 200:
-                return response.json()["choices"][0]["message"]["content"]
-            
-            logger.error(f"LLM API error: {response.status_code}")
-            return None
+            with response:
+                if response.status_code != 200:
+                    logger.error("LLM API error: %s", response.status_code)
+                    return None
+                if stream:
+                    return self._read_stream(response, abort_pattern)
+                return orjson.loads(response.content)["choices"][0]["message"]["content"], False
             
         except Exception as e:
-            logger.error(f"LLM request failed: {e}")
+            logger.error("LLM request failed: %s", e)
             return None
+    
+    @staticmethod
+    def _read_stream(
+        response: Any, abort_pattern: "re.Pattern[str]"
+    ) -> Tuple[str, bool]:
+        """Accumulate streamed (SSE) deltas, stopping at the first abort match."""
+        text = ""
+        checked = 0  # text[:checked] is already scanned
+        
+        for line in response.iter_lines():
+            if not line.startswith(b"data: "):
+                continue
+            data = line[6:]
+            if data == b"[DONE]":
+                break
+            
+            delta = orjson.loads(data)["choices"][0]["delta"].get("content")
+            if not delta:
+                continue
+            text += delta
+            
+            # Scan only up to the last whitespace: the word being streamed
+            # can still grow ("or" -> "order"). Back up far enough to catch
+            # a multi-word match straddling the previous scan boundary.
+            end = max(text.rfind(" "), text.rfind("\n"))
+            if end > checked:
+                start = max(0, checked - _FORBIDDEN_MAX_LEN)
+                if abort_pattern.search(text, start, end):
+                    logger.info("Aborting LLM stream at first forbidden word")
+                    return text, True
+                checked = end
+        
+        return text, False
 
 
 # =============================================================================
@@ -192,12 +291,7 @@ class OutputValidator:
 
     @staticmethod
     def validate(text: str) -> List[str]:
-        violations = []
-        lowered = text.lower()
-
-        for word in FORBIDDEN_WORDS:
-            if re.search(rf"\b{re.escape(word)}\b", lowered):
-                violations.append(f"Forbidden word detected: '{word}'")
+        violations = OutputValidator.forbidden_words(text)
 
         for section in MANDATORY_SECTIONS:
             if section not in text:
@@ -205,6 +299,17 @@ class OutputValidator:
 
         return violations
 
+    @staticmethod
+    def forbidden_words(text: str) -> List[str]:
+        """Forbidden-word violations only (for partial, aborted output)."""
+        # One pass for every forbidden word; report in FORBIDDEN_WORDS order
+        found = {match.lower() for match in _FORBIDDEN_RE.findall(text)}
+        return [
+            f"Forbidden word detected: '{word}'"
+            for word in FORBIDDEN_WORDS
+            if word in found
+        ]
+
 
 # =============================================================================
 # FRAMEWORK REGISTRY
@@ -215,6 +320,7 @@ class FrameworkRegistry:
     """Registry for all cognitive frameworks."""
     
     def __init__(self):
+        # Specs are static; every registry shares the table built at first use
         self._frameworks = self._build()
     
     def get(self, framework: Framework) -> FrameworkSpec:
@@ -223,121 +329,318 @@ class FrameworkRegistry:
     def get_all(self) -> List[FrameworkSpec]:
         return list(self._frameworks.values())
     
-    def _build(self) -> Dict[Framework, FrameworkSpec]:
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _build() -> Dict[Framework, FrameworkSpec]:
         return {
             Framework.CODING: FrameworkSpec(
                 framework=Framework.CODING,
                 name="Coding & Development",
                 description="Architecture clarity, deterministic behavior, production-grade systems",
-                targets=["Senior Software Engineer", "Production-grade", "No prototypes"],
-                enforcements=[
+                targets=("Senior Software Engineer", "Production-grade", "No prototypes"),
+                enforcements=(
                     "Single tech stack decided",
                     "Modular architecture",
                     "Explicit error handling",
                     "Type safety enforced",
-                ],
-                avoidances=["Generic best practices", "Optional alternatives", "Prototype patterns"],
-                triggers=["code", "build", "implement", "function", "api", "debug", "fix", "create", "develop", "program", "script", "database", "backend", "frontend", "app"],
-                ideal_for=["Code generation", "System design", "Debugging", "API development"],
+                ),
+                avoidances=("Generic best practices", "Optional alternatives", "Prototype patterns"),
+                triggers=("code", "build", "implement", "function", "api", "debug", "fix", "create", "develop", "program", "script", "database", "backend", "frontend", "app"),
+                ideal_for=("Code generation", "System design", "Debugging", "API development"),
             ),
             
             Framework.TEACHING: FrameworkSpec(
                 framework=Framework.TEACHING,
                 name="Teaching & Learning",
                 description="Progressive complexity, concept sequencing, retention-focused",
-                targets=["Expert Instructor", "Progressive complexity", "Retention-focused"],
-                enforcements=[
+                targets=("Expert Instructor", "Progressive complexity", "Retention-focused"),
+                enforcements=(
                     "Prerequisites stated first",
                     "One concept per section",
                     "Simple → Abstract progression",
                     "Verification checkpoints",
-                ],
-                avoidances=["Information dumping", "Mixed difficulty", "Tangents"],
-                triggers=["teach", "learn", "how to", "tutorial", "guide", "understand", "beginner", "step by step", "explain how", "show me"],
-                ideal_for=["Tutorials", "Educational content", "Skill building", "Onboarding"],
+                ),
+                avoidances=("Information dumping", "Mixed difficulty", "Tangents"),
+                triggers=("teach", "learn", "how to", "tutorial", "guide", "understand", "beginner", "step by step", "explain how", "show me"),
+                ideal_for=("Tutorials", "Educational content", "Skill building", "Onboarding"),
             ),
             
             Framework.EXPLANATION: FrameworkSpec(
                 framework=Framework.EXPLANATION,
                 name="Explanation",
                 description="High signal density, zero fluff, technically precise",
-                targets=["Domain Expert", "High signal density", "Zero fluff"],
-                enforcements=[
+                targets=("Domain Expert", "High signal density", "Zero fluff"),
+                enforcements=(
                     "Definition → Mechanism → Example → Limitation",
                     "Every sentence adds information",
                     "Explicit boundaries",
-                ],
-                avoidances=["Storytelling", "Metaphor overload", "Redundancy"],
-                triggers=["what is", "explain", "describe", "tell me about", "overview", "summary", "eli5", "difference between"],
-                ideal_for=["Concept explanations", "Technical documentation", "Knowledge transfer"],
+                ),
+                avoidances=("Storytelling", "Metaphor overload", "Redundancy"),
+                triggers=("what is", "explain", "describe", "tell me about", "overview", "summary", "eli5", "difference between"),
+                ideal_for=("Concept explanations", "Technical documentation", "Knowledge transfer"),
             ),
             
             Framework.RESEARCH: FrameworkSpec(
                 framework=Framework.RESEARCH,
                 name="Research & Analysis",
                 description="Evidence-based, analytically rigorous, structured inquiry",
-                targets=["Research Analyst", "Evidence-based", "Analytically rigorous"],
-                enforcements=[
+                targets=("Research Analyst", "Evidence-based", "Analytically rigorous"),
+                enforcements=(
                     "Explicit research question",
                     "Scope boundaries defined",
                     "Assumptions declared",
                     "Evidence-backed claims only",
-                ],
-                avoidances=["Opinions without evidence", "Broad wandering", "Speculation"],
-                triggers=["research", "analyze", "compare", "investigate", "study", "evaluate", "assess", "pros and cons", "tradeoffs"],
-                ideal_for=["Market research", "Technical analysis", "Decision support", "Due diligence"],
+                ),
+                avoidances=("Opinions without evidence", "Broad wandering", "Speculation"),
+                triggers=("research", "analyze", "compare", "investigate", "study", "evaluate", "assess", "pros and cons", "tradeoffs"),
+                ideal_for=("Market research", "Technical analysis", "Decision support", "Due diligence"),
             ),
             
             Framework.CREATIVE: FrameworkSpec(
                 framework=Framework.CREATIVE,
                 name="Creative & Design",
                 description="Constrained creativity, taste-controlled, visual coherence",
-                targets=["Creative Director", "Constrained creativity", "Taste-controlled"],
-                enforcements=[
+                targets=("Creative Director", "Constrained creativity", "Taste-controlled"),
+                enforcements=(
                     "Visual direction rules explicit",
                     "Style constraints with values",
                     "Single mood anchor",
                     "Boundaries defined",
-                ],
-                avoidances=["Unbounded creativity", "Vague aesthetics", "Multiple directions"],
-                triggers=["design", "creative", "brainstorm", "ideas", "story", "visual", "aesthetic", "style", "brand", "ui", "ux"],
-                ideal_for=["UI/UX design", "Creative writing", "Brand development", "Visual concepts"],
+                ),
+                avoidances=("Unbounded creativity", "Vague aesthetics", "Multiple directions"),
+                triggers=("design", "creative", "brainstorm", "ideas", "story", "visual", "aesthetic", "style", "brand", "ui", "ux"),
+                ideal_for=("UI/UX design", "Creative writing", "Brand development", "Visual concepts"),
             ),
             
             Framework.STRATEGY: FrameworkSpec(
                 framework=Framework.STRATEGY,
                 name="Strategy & Thinking",
                 description="First-principles reasoning, decision-grade clarity, single recommendation",
-                targets=["Strategic Advisor", "First-principles", "Decision-grade"],
-                enforcements=[
+                targets=("Strategic Advisor", "First-principles", "Decision-grade"),
+                enforcements=(
                     "Problem reframed from first principles",
                     "Hard constraints identified",
                     "Options with criteria",
                     "Single recommendation",
-                ],
-                avoidances=["Motivational language", "Generic advice", "Hedging"],
-                triggers=["decide", "should i", "strategy", "plan", "approach", "solve", "problem", "optimize", "improve", "best way"],
-                ideal_for=["Strategic planning", "Decision making", "Problem solving", "Process optimization"],
+                ),
+                avoidances=("Motivational language", "Generic advice", "Hedging"),
+                triggers=("decide", "should i", "strategy", "plan", "approach", "solve", "problem", "optimize", "improve", "best way"),
+                ideal_for=("Strategic planning", "Decision making", "Problem solving", "Process optimization"),
             ),
             
             Framework.CONTENT: FrameworkSpec(
                 framework=Framework.CONTENT,
                 name="Content Creation",
                 description="Audience-aligned, purpose-driven, structured communication",
-                targets=["Content Strategist", "Audience-aligned", "Purpose-driven"],
-                enforcements=[
+                targets=("Content Strategist", "Audience-aligned", "Purpose-driven"),
+                enforcements=(
                     "Audience explicitly defined",
                     "Single intent locked",
                     "Tone boundaries set",
                     "Structure enforced",
-                ],
-                avoidances=["Viral bait", "Emotional padding", "Multiple drafts"],
-                triggers=["write", "draft", "email", "blog", "content", "article", "post", "message", "copy", "document"],
-                ideal_for=["Email writing", "Blog posts", "Documentation", "Marketing copy"],
+                ),
+                avoidances=("Viral bait", "Emotional padding", "Multiple drafts"),
+                triggers=("write", "draft", "email", "blog", "content", "article", "post", "message", "copy", "document"),
+                ideal_for=("Email writing", "Blog posts", "Documentation", "Marketing copy"),
             ),
         }
 
 
+# =============================================================================
+# DECISION TABLES
+# =============================================================================
+# Per-framework decisions are constants: built once at import and shared
+# (tuples, so callers cannot mutate them).
+
+
+_GOALS: Dict[Framework, str] = {
+    Framework.CODING: "Build a production-grade system with deterministic behavior",
+    Framework.TEACHING: "Teach concept progressively with verification checkpoints",
+    Framework.EXPLANATION: "Explain with high signal density and zero fluff",
+    Framework.RESEARCH: "Conduct structured analysis with evidence-backed findings",
+    Framework.CREATIVE: "Design within explicit constraints and single direction",
+    Framework.STRATEGY: "Produce single decision recommendation from first principles",
+    Framework.CONTENT: "Create structured content for defined audience"
+}
+
+
+_SCOPES: Dict[Framework, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {
+    Framework.CODING: (
+        ("Core functionality", "Error handling", "Type safety"),
+        ("Testing infrastructure", "Deployment configs", "CI/CD", "Documentation beyond inline")
+    ),
+    Framework.TEACHING: (
+        ("Core concept", "Prerequisites", "Practice exercises"),
+        ("Advanced edge cases", "Alternative approaches", "Historical context")
+    ),
+    Framework.EXPLANATION: (
+        ("Definition", "Mechanism", "Example", "Limitations"),
+        ("History", "Alternatives", "Opinions", "Comparisons")
+    ),
+    Framework.RESEARCH: (
+        ("Research question", "Methodology", "Findings", "Implications"),
+        ("Recommendations beyond scope", "Speculative futures")
+    ),
+    Framework.CREATIVE: (
+        ("Visual system", "Component design", "Interaction rules"),
+        ("Implementation code", "Backend logic", "Content strategy")
+    ),
+    Framework.STRATEGY: (
+        ("Problem reframe", "Options analysis", "Single recommendation"),
+        ("Implementation details", "Timeline", "Resource allocation")
+    ),
+    Framework.CONTENT: (
+        ("Core message", "Structure", "Call-to-action"),
+        ("Distribution strategy", "SEO", "Visual assets")
+    ),
+}
+
+_DEFAULT_SCOPES = (("Core functionality",), ("Out of scope items",))
+
+
+_CONSTRAINTS: Dict[Framework, Tuple[str, ...]] = {
+    Framework.CODING: (
+        "Stack: React 18 + TypeScript (DECIDED)",
+        "Architecture: Modular with single-responsibility",
+        "Error handling: Explicit paths for all failures",
+        "Types: Strict, no `any`, no implicit",
+        "Functions: Maximum 40 lines, single purpose",
+    ),
+    Framework.TEACHING: (
+        "Prerequisites: Stated before content",
+        "Concept limit: One per section maximum",
+        "Progression: Simple → Applied → Abstract (strict)",
+        "Validation: Each section ends with checkpoint",
+    ),
+    Framework.EXPLANATION: (
+        "Structure: Definition → Mechanism → Example → Limitation (mandatory)",
+        "Density: Every sentence adds unique information",
+        "Separation: Intuition vs implementation distinct",
+        "Boundaries: State what does NOT apply",
+    ),
+    Framework.RESEARCH: (
+        "Research question: Explicitly stated first",
+        "Scope: Defined boundaries (in/out)",
+        "Assumptions: Declared upfront",
+        "Evidence: No claims without backing",
+    ),
+    Framework.CREATIVE: (
+        "Colors: Max 5 in palette",
+        "Typography: Single scale, max 3 weights",
+        "Spacing: 4px/8px grid system",
+        "Mood: Single anchor (Professional-minimal)",
+    ),
+    Framework.STRATEGY: (
+        "Reframe: Problem restated from first principles",
+        "Options: Exactly 3 distinct paths",
+        "Criteria: Explicit decision factors with weights",
+        "No: Motivational language, generic advice, hedging",
+    ),
+    Framework.CONTENT: (
+        "Audience: Technical professionals (DECIDED)",
+        "Intent: Inform (single purpose)",
+        "Tone: Professional, direct, no contractions",
+        "Length: 500-800 words",
+    ),
+}
+
+_DEFAULT_CONSTRAINTS = ("Single responsibility per module", "No optional features")
+
+
+_EXECUTIONS: Dict[Framework, Tuple[str, ...]] = {
+    Framework.CODING: (
+        "Define file structure and module boundaries",
+        "Establish interfaces and type contracts",
+        "Implement core logic with input validation",
+        "Add error boundaries and edge cases",
+        "Include usage example",
+    ),
+    Framework.TEACHING: (
+        "State prerequisites and single learning outcome",
+        "Introduce concept with minimal example",
+        "Explain mechanism (not just syntax)",
+        "Provide practice exercise with expected output",
+        "Bridge to next concept",
+    ),
+    Framework.EXPLANATION: (
+        "Precise definition (one sentence)",
+        "How it works mechanistically",
+        "Concrete example with context",
+        "Limitations and edge cases",
+    ),
+    Framework.RESEARCH: (
+        "Frame precise research question",
+        "Define scope and methodology",
+        "Analyze with structured approach",
+        "Synthesize findings with evidence",
+        "State implications and limitations",
+    ),
+    Framework.CREATIVE: (
+        "Define visual constraints explicitly",
+        "Establish style rules with values",
+        "Design within boundaries",
+        "Validate against mood anchor",
+    ),
+    Framework.STRATEGY: (
+        "Reframe problem from first principles",
+        "Identify hard constraints and variables",
+        "Generate 3 distinct options",
+        "Compare against weighted criteria",
+        "Single recommendation with reasoning",
+    ),
+    Framework.CONTENT: (
+        "Define audience context and needs",
+        "Lock single content intent",
+        "Structure for scannable consumption",
+        "Apply consistent tone throughout",
+        "End with clear call-to-action",
+    ),
+}
+
+_DEFAULT_EXECUTIONS = ("Define structure", "Implement logic", "Validate", "Produce output")
+
+
+_OUTPUT_CONTRACTS: Dict[Framework, Tuple[str, ...]] = {
+    Framework.CODING: (
+        "Format: Complete, runnable TypeScript code",
+        "Deliverables: All files with imports, no placeholders",
+        "Boundaries: No test files, no deployment configs",
+    ),
+    Framework.TEACHING: (
+        "Format: Numbered sections with headers",
+        "Deliverables: Concept explanation, code example, exercise",
+        "Boundaries: No tangents, no alternatives",
+    ),
+    Framework.EXPLANATION: (
+        "Format: Four sections matching execution order",
+        "Deliverables: Definition, mechanism, example, limitations",
+        "Boundaries: No storytelling, no metaphors",
+    ),
+    Framework.RESEARCH: (
+        "Format: Structured analysis with headers",
+        "Deliverables: Question, methodology, findings, implications",
+        "Boundaries: No opinions without evidence",
+    ),
+    Framework.CREATIVE: (
+        "Format: Design specification with values",
+        "Deliverables: Color codes, spacing, typography, components",
+        "Boundaries: No alternatives, no mood boards",
+    ),
+    Framework.STRATEGY: (
+        "Format: Structured analysis with decision matrix",
+        "Deliverables: Reframed problem, 3 options, matrix, recommendation",
+        "Boundaries: No hedging, no multiple recommendations",
+    ),
+    Framework.CONTENT: (
+        "Format: Structured content with headers",
+        "Deliverables: Complete draft, ready to publish",
+        "Boundaries: No multiple drafts, no options",
+    ),
+}
+
+_DEFAULT_OUTPUT_CONTRACTS = ("Structured response", "No commentary", "No alternatives")
+
+
 # =============================================================================
 # DECISION ENGINE
 # =============================================================================
@@ -348,6 +651,11 @@ class DecisionEngine:
 
     def __init__(self, registry: Optional[FrameworkRegistry] = None):
         self.registry = registry or FrameworkRegistry()
+        # Lead persona per framework, resolved once from the registry
+        self._personas: Dict[Framework, str] = {
+            spec.framework: spec.targets[0] if spec.targets else "Expert"
+            for spec in self.registry.get_all()
+        }
 
     def decide_platform(self, text: str) -> str:
         text_lower = text.lower()
@@ -360,194 +668,23 @@ class DecisionEngine:
         return "Web Application"
 
     def decide_goal(self, framework: Framework) -> str:
-        goals = {
-            Framework.CODING: "Build a production-grade system with deterministic behavior",
-            Framework.TEACHING: "Teach concept progressively with verification checkpoints",
-            Framework.EXPLANATION: "Explain with high signal density and zero fluff",
-            Framework.RESEARCH: "Conduct structured analysis with evidence-backed findings",
-            Framework.CREATIVE: "Design within explicit constraints and single direction",
-            Framework.STRATEGY: "Produce single decision recommendation from first principles",
-            Framework.CONTENT: "Create structured content for defined audience"
-        }
-        return goals[framework]
+        return _GOALS[framework]
 
     def decide_persona(self, framework: Framework) -> str:
-        spec = self.registry.get(framework)
-        return spec.targets[0] if spec.targets else "Expert"
+        return self._personas[framework]
     
-    def decide_scope(self, framework: Framework) -> Tuple[List[str], List[str]]:
-        """Returns (included, excluded) scope lists."""
-        scopes = {
-            Framework.CODING: (
-                ["Core functionality", "Error handling", "Type safety"],
-                ["Testing infrastructure", "Deployment configs", "CI/CD", "Documentation beyond inline"]
-            ),
-            Framework.TEACHING: (
-                ["Core concept", "Prerequisites", "Practice exercises"],
-                ["Advanced edge cases", "Alternative approaches", "Historical context"]
-            ),
-            Framework.EXPLANATION: (
-                ["Definition", "Mechanism", "Example", "Limitations"],
-                ["History", "Alternatives", "Opinions", "Comparisons"]
-            ),
-            Framework.RESEARCH: (
-                ["Research question", "Methodology", "Findings", "Implications"],
-                ["Recommendations beyond scope", "Speculative futures"]
-            ),
-            Framework.CREATIVE: (
-                ["Visual system", "Component design", "Interaction rules"],
-                ["Implementation code", "Backend logic", "Content strategy"]
-            ),
-            Framework.STRATEGY: (
-                ["Problem reframe", "Options analysis", "Single recommendation"],
-                ["Implementation details", "Timeline", "Resource allocation"]
-            ),
-            Framework.CONTENT: (
-                ["Core message", "Structure", "Call-to-action"],
-                ["Distribution strategy", "SEO", "Visual assets"]
-            ),
-        }
-        return scopes.get(framework, (["Core functionality"], ["Out of scope items"]))
-
-    def decide_constraints(self, framework: Framework) -> List[str]:
-        constraints = {
-            Framework.CODING: [
-                "Stack: React 18 + TypeScript (DECIDED)",
-                "Architecture: Modular with single-responsibility",
-                "Error handling: Explicit paths for all failures",
-                "Types: Strict, no `any`, no implicit",
-                "Functions: Maximum 40 lines, single purpose",
-            ],
-            Framework.TEACHING: [
-                "Prerequisites: Stated before content",
-                "Concept limit: One per section maximum",
-                "Progression: Simple → Applied → Abstract (strict)",
-                "Validation: Each section ends with checkpoint",
-            ],
-            Framework.EXPLANATION: [
-                "Structure: Definition → Mechanism → Example → Limitation (mandatory)",
-                "Density: Every sentence adds unique information",
-                "Separation: Intuition vs implementation distinct",
-                "Boundaries: State what does NOT apply",
-            ],
-            Framework.RESEARCH: [
-                "Research question: Explicitly stated first",
-                "Scope: Defined boundaries (in/out)",
-                "Assumptions: Declared upfront",
-                "Evidence: No claims without backing",
-            ],
-            Framework.CREATIVE: [
-                "Colors: Max 5 in palette",
-                "Typography: Single scale, max 3 weights",
-                "Spacing: 4px/8px grid system",
-                "Mood: Single anchor (Professional-minimal)",
-            ],
-            Framework.STRATEGY: [
-                "Reframe: Problem restated from first principles",
-                "Options: Exactly 3 distinct paths",
-                "Criteria: Explicit decision factors with weights",
-                "No: Motivational language, generic advice, hedging",
-            ],
-            Framework.CONTENT: [
-                "Audience: Technical professionals (DECIDED)",
-                "Intent: Inform (single purpose)",
-                "Tone: Professional, direct, no contractions",
-                "Length: 500-800 words",
-            ],
-        }
-        return constraints.get(framework, ["Single responsibility per module", "No optional features"])
-
-    def decide_execution(self, framework: Framework) -> List[str]:
-        executions = {
-            Framework.CODING: [
-                "Define file structure and module boundaries",
-                "Establish interfaces and type contracts",
-                "Implement core logic with input validation",
-                "Add error boundaries and edge cases",
-                "Include usage example",
-            ],
-            Framework.TEACHING: [
-                "State prerequisites and single learning outcome",
-                "Introduce concept with minimal example",
-                "Explain mechanism (not just syntax)",
-                "Provide practice exercise with expected output",
-                "Bridge to next concept",
-            ],
-            Framework.EXPLANATION: [
-                "Precise definition (one sentence)",
-                "How it works mechanistically",
-                "Concrete example with context",
-                "Limitations and edge cases",
-            ],
-            Framework.RESEARCH: [
-                "Frame precise research question",
-                "Define scope and methodology",
-                "Analyze with structured approach",
-                "Synthesize findings with evidence",
-                "State implications and limitations",
-            ],
-            Framework.CREATIVE: [
-                "Define visual constraints explicitly",
-                "Establish style rules with values",
-                "Design within boundaries",
-                "Validate against mood anchor",
-            ],
-            Framework.STRATEGY: [
-                "Reframe problem from first principles",
-                "Identify hard constraints and variables",
-                "Generate 3 distinct options",
-                "Compare against weighted criteria",
-                "Single recommendation with reasoning",
-            ],
-            Framework.CONTENT: [
-                "Define audience context and needs",
-                "Lock single content intent",
-                "Structure for scannable consumption",
-                "Apply consistent tone throughout",
-                "End with clear call-to-action",
-            ],
-        }
-        return executions.get(framework, ["Define structure", "Implement logic", "Validate", "Produce output"])
-
-    def decide_output_contract(self, framework: Framework) -> List[str]:
-        contracts = {
-            Framework.CODING: [
-                "Format: Complete, runnable TypeScript code",
-                "Deliverables: All files with imports, no placeholders",
-                "Boundaries: No test files, no deployment configs",
-            ],
-            Framework.TEACHING: [
-                "Format: Numbered sections with headers",
-                "Deliverables: Concept explanation, code example, exercise",
-                "Boundaries: No tangents, no alternatives",
-            ],
-            Framework.EXPLANATION: [
-                "Format: Four sections matching execution order",
-                "Deliverables: Definition, mechanism, example, limitations",
-                "Boundaries: No storytelling, no metaphors",
-            ],
-            Framework.RESEARCH: [
-                "Format: Structured analysis with headers",
-                "Deliverables: Question, methodology, findings, implications",
-                "Boundaries: No opinions without evidence",
-            ],
-            Framework.CREATIVE: [
-                "Format: Design specification with values",
-                "Deliverables: Color codes, spacing, typography, components",
-                "Boundaries: No alternatives, no mood boards",
-            ],
-            Framework.STRATEGY: [
-                "Format: Structured analysis with decision matrix",
-                "Deliverables: Reframed problem, 3 options, matrix, recommendation",
-                "Boundaries: No hedging, no multiple recommendations",
-            ],
-            Framework.CONTENT: [
-                "Format: Structured content with headers",
-                "Deliverables: Complete draft, ready to publish",
-                "Boundaries: No multiple drafts, no options",
-            ],
-        }
-        return contracts.get(framework, ["Structured response", "No commentary", "No alternatives"])
+    def decide_scope(self, framework: Framework) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """Returns (included, excluded) scope tuples."""
+        return _SCOPES.get(framework, _DEFAULT_SCOPES)
+
+    def decide_constraints(self, framework: Framework) -> Tuple[str, ...]:
+        return _CONSTRAINTS.get(framework, _DEFAULT_CONSTRAINTS)
+
+    def decide_execution(self, framework: Framework) -> Tuple[str, ...]:
+        return _EXECUTIONS.get(framework, _DEFAULT_EXECUTIONS)
+
+    def decide_output_contract(self, framework: Framework) -> Tuple[str, ...]:
+        return _OUTPUT_CONTRACTS.get(framework, _DEFAULT_OUTPUT_CONTRACTS)
 
 
 # =============================================================================
@@ -555,6 +692,48 @@ class DecisionEngine:
 # =============================================================================
 
 
+def _bullets(items: Sequence[str]) -> str:
+    """Render items as a "- " bulleted list with one join, no per-item strings."""
+    return "- " + "\n- ".join(items) if items else ""
+
+
+@lru_cache(maxsize=256)
+def _assemble_sections(
+    scope_in: Tuple[str, ...],
+    scope_out: Tuple[str, ...],
+    constraints: Tuple[str, ...],
+    execution: Tuple[str, ...],
+    output_contract: Tuple[str, ...],
+) -> str:
+    """
+    Render the SCOPE..OUTPUT CONTRACT block.
+    
+    These lists come from DecisionEngine and depend only on the framework,
+    so the block is rendered once per framework and reused.
+    """
+    scope_in_str = _bullets(scope_in)
+    scope_out_str = _bullets(scope_out)
+    constraints_str = _bullets(constraints)
+    execution_str = "\n".join(f"{i}. {e}" for i, e in enumerate(execution, 1))
+    output_str = _bullets(output_contract)
+
+    return f"""SCOPE
+Included:
+{scope_in_str}
+
+Excluded:
+{scope_out_str}
+
+CONSTRAINTS
+{constraints_str}
+
+EXECUTION
+{execution_str}
+
+OUTPUT CONTRACT
+{output_str}"""
+
+
 class StructureAssembler:
     """Assembles the final structured prompt."""
 
@@ -569,11 +748,14 @@ class StructureAssembler:
         execution: List[str],
         output_contract: List[str]
     ) -> str:
-        scope_in_str = "\n".join(f"- {s}" for s in scope_in)
-        scope_out_str = "\n".join(f"- {s}" for s in scope_out)
-        constraints_str = "\n".join(f"- {c}" for c in constraints)
-        execution_str = "\n".join(f"{i+1}. {e}" for i, e in enumerate(execution))
-        output_str = "\n".join(f"- {o}" for o in output_contract)
+        # Only the header varies per input (objective embeds the user text)
+        sections = _assemble_sections(
+            tuple(scope_in),
+            tuple(scope_out),
+            tuple(constraints),
+            tuple(execution),
+            tuple(output_contract),
+        )
 
         return f"""ROLE
 {persona}
@@ -584,21 +766,7 @@ PLATFORM
 OBJECTIVE
 {objective}
 
-SCOPE
-Included:
-{scope_in_str}
-
-Excluded:
-{scope_out_str}
-
-CONSTRAINTS
-{constraints_str}
-
-EXECUTION
-{execution_str}
-
-OUTPUT CONTRACT
-{output_str}"""
+{sections}"""
 
 
 # =============================================================================
@@ -611,24 +779,30 @@ class FrameworkClassifier:
     
     def __init__(self, registry: Optional[FrameworkRegistry] = None):
         self.registry = registry or FrameworkRegistry()
+        # (framework, reasoning, triggers) in registry order, built once
+        self._trigger_table: Tuple[Tuple[Framework, str, Tuple[str, ...]], ...] = tuple(
+            (spec.framework, f"Classified as {spec.name}", spec.triggers)
+            for spec in self.registry.get_all()
+        )
     
     def classify(self, user_input: str) -> Tuple[Framework, float, str]:
         """Classify input into most appropriate framework."""
-        input_lower = user_input.lower()
-        scores: Dict[Framework, int] = {}
+        # Score = number of distinct triggers found as substrings. Plain `in`
+        # scans beat one big regex alternation here (CPython's re tries every
+        # branch at each position) and keep overlapping triggers counted
+        # (e.g. "build" also contains "ui").
+        contains = user_input.lower().__contains__
+        best, best_score, reasoning = Framework.CODING, 0, "Default classification"
         
-        for spec in self.registry.get_all():
-            score = sum(1 for trigger in spec.triggers if trigger in input_lower)
-            scores[spec.framework] = score
+        for framework, framework_reasoning, triggers in self._trigger_table:
+            score = sum(map(contains, triggers))
+            if score > best_score:  # Ties keep the earlier framework
+                best, best_score, reasoning = framework, score, framework_reasoning
         
-        if not scores or max(scores.values()) == 0:
+        if best_score == 0:
             return Framework.CODING, 0.5, "Default classification"
         
-        best = max(scores, key=scores.get)  # type: ignore
-        confidence = min(scores[best] / 5, 1.0)
-        spec = self.registry.get(best)
-        
-        return best, confidence, f"Classified as {spec.name}"
+        return best, min(best_score / 5, 1.0), reasoning
 
 
 # =============================================================================
@@ -652,11 +826,18 @@ class StaticStructurer:
         self,
         user_input: str,
         framework: Framework,
+        cleaned_input: Optional[str] = None,
     ) -> OptimizedPrompt:
-        """Generate deterministic structured output without LLM."""
+        """
+        Generate deterministic structured output without LLM.
+        
+        Callers that already ran _clean_input pass the result as
+        cleaned_input to skip a second pass over the input.
+        """
         
         spec = self.registry.get(framework)
-        cleaned_input = self._clean_input(user_input)
+        if cleaned_input is None:
+            cleaned_input = self._clean_input(user_input)
         
         # Make all decisions deterministically
         persona = self.decider.decide_persona(framework)
@@ -687,24 +868,90 @@ class StaticStructurer:
             framework_name=spec.name,
             prompt=structured,
             valid=len(violations) == 0,
-            violations=violations,
+            violations=tuple(violations),
             confidence=1.0,
             generation_mode="static"
         )
 
     def _clean_input(self, text: str) -> str:
         """Remove filler and forbidden words from input."""
-        filler_patterns = [
-            r'\b(please|kindly|could you|can you|i want to|i need to|i would like to)\b',
-            r'\b(maybe|possibly|perhaps|something like|sort of|kind of)\b',
-            r'\b(basically|actually|honestly|literally)\b',
-        ]
-        
-        for pattern in filler_patterns:
-            text = re.sub(pattern, '', text, flags=re.IGNORECASE)
-        
-        text = ' '.join(text.split())
-        return text.strip()
+        # Strip filler, then collapse whitespace
+        return " ".join(_FILLER_RE.sub("", text).split())
+
+
+# Explicit framework resolution tables (see PromptOptimizer._resolve_framework)
+_FRAMEWORK_NAMES: Tuple[Tuple[Framework, str, str], ...] = tuple(
+    (fw, fw.value, fw.name.lower()) for fw in Framework
+)
+_FRAMEWORK_IDS: Dict[str, Framework] = {
+    **{fw.name.lower(): fw for fw in Framework},
+    **{fw.value: fw for fw in Framework},
+}
+_FRAMEWORK_KEYWORDS: Tuple[Tuple[str, Framework], ...] = (
+    ("coding", Framework.CODING),
+    ("code", Framework.CODING),
+    ("build", Framework.CODING),
+    ("teaching", Framework.TEACHING),
+    ("learn", Framework.TEACHING),
+    ("explain", Framework.EXPLANATION),
+    ("research", Framework.RESEARCH),
+    ("analyze", Framework.RESEARCH),
+    ("creative", Framework.CREATIVE),
+    ("design", Framework.CREATIVE),
+    ("strategy", Framework.STRATEGY),
+    ("decide", Framework.STRATEGY),
+    ("content", Framework.CONTENT),
+    ("write", Framework.CONTENT),
+)
+
+
+@lru_cache(maxsize=32)
+def _system_prompt(name: str, description: str) -> str:
+    """
+    Render the LLM system prompt for one framework.
+    
+    Depends only on the framework's name and description, so it is built
+    once per framework and reused across attempts and requests.
+    """
+    return f"""You are a structured prompt compiler.
+
+ROLE: Expert Prompt Structurer
+SYSTEM: Cognition Structuring Engine v7.0
+
+FRAMEWORK: {name}
+{description}
+
+YOU MUST:
+
+1. ENFORCE mandatory sections:
+   - ROLE: Who this prompt is for
+   - PLATFORM: Where execution happens
+   - OBJECTIVE: What the task is
+   - SCOPE: What's in/out
+   - CONSTRAINTS: Hard rules
+   - EXECUTION: Step-by-step process
+   - OUTPUT CONTRACT: Exact deliverables
+
+2. FORBIDDEN WORDS: Never use these
+   {", ".join(FORBIDDEN_WORDS)}
+   
+   If you use them, your output will be REJECTED.
+
+3. DECISIONS: Make them explicitly
+   - Choose platform clearly (not "maybe")
+   - Define boundaries explicitly
+   - State role with authority
+   - No ambiguity. No hedging.
+
+4. OUTPUT: Only return the structured prompt
+   - No commentary
+   - No markdown formatting
+   - No explanations
+   - Just the structure
+
+Remember: This is a compiler, not a chatbot.
+Output must be VALID or REJECTED.
+There is no "almost correct"."""
 
 
 # =============================================================================
@@ -728,6 +975,8 @@ class PromptOptimizer:
 
     MAX_RETRIES = 2
     RETRY_BACKOFF = 1.5  # Temperature multiplier for retries
+    STATIC_CACHE_SIZE = 1024  # Memoized StaticStructurer results
+    GENERATION_CACHE_SIZE = 1024  # Validated LLM outputs kept for reuse
 
     def __init__(
         self,
@@ -740,7 +989,20 @@ class PromptOptimizer:
         self.assembler = StructureAssembler()
         self.llm_provider = llm_provider or GroqProvider()
         self.static_structurer = StaticStructurer(self.registry)
+        # Static output depends only on (input, framework): memoize repeats.
+        # The wrapper pins the key to those two arguments so every caller
+        # (forced static, no provider, LLM fallback) shares one entry
+        structure = self.static_structurer.structure
+
+        @lru_cache(maxsize=self.STATIC_CACHE_SIZE)
+        def structure_static(user_input: str, framework: Framework) -> OptimizedPrompt:
+            return structure(user_input, framework)
+
+        self._structure_static = structure_static
         self.validator = OutputValidator()
+        # (framework, cleaned_input) -> validated LLM output, LRU-ordered
+        self._generation_cache: "OrderedDict[Tuple[Framework, str], str]" = OrderedDict()
+        self._generation_cache_lock = threading.Lock()
 
     def optimize(
         self,
@@ -759,11 +1021,10 @@ class PromptOptimizer:
         Raises: ValueError if input is invalid
         """
         
-        if not user_input or not user_input.strip():
+        # isspace() answers the same question as strip() without copying
+        if not user_input or user_input.isspace():
             raise ValueError("Input cannot be empty")
         
-        cleaned_input = self._clean_input(user_input)
-        
         # Classify framework
         if explicit_framework:
             framework, confidence = self._resolve_framework(explicit_framework)
@@ -772,77 +1033,117 @@ class PromptOptimizer:
         
         # If static is forced, skip LLM entirely
         if force_static:
-            logger.info(f"Static mode forced. Using StaticStructurer for {framework.name}")
-            return self.static_structurer.structure(user_input, framework)
+            logger.info("Static mode forced. Using StaticStructurer for %s", framework.name)
+            return self._structure_static(user_input, framework)
+        
+        # No provider (e.g. no API key): every attempt would fail, go static
+        if not self.llm_provider.is_available:
+            logger.debug("LLM provider not available. Using StaticStructurer")
+            return self._structure_static(user_input, framework)
+        
+        # Cleaned once; shared by every LLM attempt and the cache key
+        cleaned_input = self._clean_input(user_input)
+        
+        # Inputs differing only in filler/whitespace reuse a validated output
+        cache_key = (framework, cleaned_input)
+        cached = self._get_cached_generation(cache_key)
+        if cached is not None:
+            return self._dynamic_result(framework, cached, confidence)
         
         # CONTROL LOOP: Generate → Validate → (Regenerate or Fallback)
-        violation_history: List[str] = []
+        # Ordered set: a rule broken on several attempts is reported once
+        violation_history: Dict[str, None] = {}
         
         for attempt in range(self.MAX_RETRIES + 1):
-            logger.debug(f"Optimization attempt {attempt + 1}/{self.MAX_RETRIES + 1}")
+            logger.debug("Optimization attempt %d/%d", attempt + 1, self.MAX_RETRIES + 1)
             
             # STEP 1: GENERATE
-            generated = self._generate_with_llm(
-                user_input=user_input,
-                cleaned_input=cleaned_input,
+            result = self._generate_with_llm(
+                cleaned_input=cleaned_input or user_input,
                 framework=framework,
                 attempt=attempt,
-                violation_feedback=violation_history,
+                violation_feedback=tuple(violation_history),
             )
             
-            if generated is None:
-                logger.warning(f"LLM generation failed on attempt {attempt + 1}")
+            if result is None:
+                logger.warning("LLM generation failed on attempt %d", attempt + 1)
                 if attempt == self.MAX_RETRIES:
                     logger.info("Max retries reached. Falling back to StaticStructurer")
-                    return self.static_structurer.structure(user_input, framework)
+                    return self._structure_static(user_input, framework)
                 continue
             
             # STEP 2: VALIDATE
-            violations = self.validator.validate(generated)
+            # An aborted stream is cut short at its first forbidden word; its
+            # missing sections are an artifact of the abort, not the model
+            generated, aborted = result
+            if aborted:
+                violations = self.validator.forbidden_words(generated)
+            else:
+                violations = self.validator.validate(generated)
             
             # STEP 3: REJECT OR ACCEPT
             if not violations:
-                # Valid! Return it
-                spec = self.registry.get(framework)
-                logger.info(f"Output validated successfully on attempt {attempt + 1}")
-                return OptimizedPrompt(
-                    framework=framework,
-                    framework_name=spec.name,
-                    prompt=generated,
-                    valid=True,
-                    violations=[],
-                    confidence=confidence,
-                    generation_mode="dynamic"
-                )
+                # Valid! Cache and return it
+                logger.info("Output validated successfully on attempt %d", attempt + 1)
+                self._cache_generation(cache_key, generated)
+                return self._dynamic_result(framework, generated, confidence)
             
             # STEP 4: REJECT AND REGENERATE
-            violation_history.extend(violations)
-            logger.warning(f"Output invalid on attempt {attempt + 1}. Violations: {violations}")
+            violation_history.update(dict.fromkeys(violations))
+            logger.warning("Output invalid on attempt %d. Violations: %s", attempt + 1, violations)
             
             if attempt == self.MAX_RETRIES:
                 # Retries exhausted → Fall back to static
-                logger.info(f"Max retries ({self.MAX_RETRIES}) reached. Using StaticStructurer fallback")
-                return self.static_structurer.structure(user_input, framework)
+                logger.info("Max retries (%d) reached. Using StaticStructurer fallback", self.MAX_RETRIES)
+                return self._structure_static(user_input, framework)
             
             # Continue to next attempt with accumulated feedback
         
         # This should never be reached, but safety net
         logger.critical("Unexpected control flow. Defaulting to static structurer")
-        return self.static_structurer.structure(user_input, framework)
+        return self._structure_static(user_input, framework)
+
+    def _dynamic_result(
+        self,
+        framework: Framework,
+        prompt: str,
+        confidence: float,
+    ) -> OptimizedPrompt:
+        """Wrap a validated LLM output."""
+        return OptimizedPrompt(
+            framework=framework,
+            framework_name=self.registry.get(framework).name,
+            prompt=prompt,
+            valid=True,
+            violations=(),
+            confidence=confidence,
+            generation_mode="dynamic"
+        )
+
+    def _get_cached_generation(self, key: Tuple[Framework, str]) -> Optional[str]:
+        """Return a cached LLM output and mark it most recently used."""
+        with self._generation_cache_lock:
+            prompt = self._generation_cache.get(key)
+            if prompt is not None:
+                self._generation_cache.move_to_end(key)
+            return prompt
+
+    def _cache_generation(self, key: Tuple[Framework, str], prompt: str) -> None:
+        """Store a validated LLM output, evicting the least recently used."""
+        with self._generation_cache_lock:
+            self._generation_cache[key] = prompt
+            self._generation_cache.move_to_end(key)
+            if len(self._generation_cache) > self.GENERATION_CACHE_SIZE:
+                self._generation_cache.popitem(last=False)
 
     def _generate_with_llm(
         self,
-        user_input: str,
         cleaned_input: str,
         framework: Framework,
         attempt: int,
-        violation_feedback: List[str],
-    ) -> Optional[str]:
-        """Generate structured output using LLM."""
-        
-        if not self.llm_provider.is_available:
-            logger.debug("LLM provider not available. Skipping LLM generation")
-            return None
+        violation_feedback: Sequence[str],
+    ) -> Optional[Tuple[str, bool]]:
+        """Generate structured output using LLM; returns (text, aborted)."""
         
         spec = self.registry.get(framework)
         
@@ -854,7 +1155,7 @@ class PromptOptimizer:
             # First attempt: normal prompt
             user_prompt = f"""Optimize this input into a structured prompt:
 
-INPUT: {user_input}
+INPUT: {cleaned_input}
 
 FRAMEWORK: {spec.name}
 
@@ -864,11 +1165,11 @@ No exceptions. No shortcuts.
 Return ONLY the structured prompt. No explanations."""
         else:
             # Retry attempt: include violation feedback
-            violations_text = "\n".join(f"- {v}" for v in violation_feedback)
+            violations_text = _bullets(violation_feedback)
             user_prompt = f"""Your previous output violated the following rules:
 {violations_text}
 
-INPUT: {user_input}
+INPUT: {cleaned_input}
 FRAMEWORK: {spec.name}
 
 REGENERATE the prompt correcting ALL violations.
@@ -879,156 +1180,43 @@ Do not explain changes. Return ONLY the structured prompt."""
         temp = 0.3 * (self.RETRY_BACKOFF ** attempt)
         temp = min(temp, 1.0)  # Cap at 1.0
         
+        # Stream and stop at the first forbidden word: that output is
+        # rejected anyway, so the remaining tokens are not worth waiting for
         generated = self.llm_provider.generate(
             system_prompt=system_prompt,
             user_input=user_prompt,
             temperature=temp,
             max_tokens=2000,
+            abort_pattern=_FORBIDDEN_RE,
         )
         
         return generated
 
     def _build_system_prompt(self, framework: Framework, spec: FrameworkSpec) -> str:
         """Build the system prompt for the LLM."""
-        
-        return f"""You are a structured prompt compiler.
-
-ROLE: Expert Prompt Structurer
-SYSTEM: Cognition Structuring Engine v7.0
-
-FRAMEWORK: {spec.name}
-{spec.description}
-
-YOU MUST:
+        return _system_prompt(spec.name, spec.description)
 
-1. ENFORCE mandatory sections:
-   - ROLE: Who this prompt is for
-   - PLATFORM: Where execution happens
-   - OBJECTIVE: What the task is
-   - SCOPE: What's in/out
-   - CONSTRAINTS: Hard rules
-   - EXECUTION: Step-by-step process
-   - OUTPUT CONTRACT: Exact deliverables
-
-2. FORBIDDEN WORDS: Never use these
-   {", ".join(FORBIDDEN_WORDS)}
-   
-   If you use them, your output will be REJECTED.
-
-3. DECISIONS: Make them explicitly
-   - Choose platform clearly (not "maybe")
-   - Define boundaries explicitly
-   - State role with authority
-   - No ambiguity. No hedging.
-
-4. OUTPUT: Only return the structured prompt
-   - No commentary
-   - No markdown formatting
-   - No explanations
-   - Just the structure
-
-Remember: This is a compiler, not a chatbot.
-Output must be VALID or REJECTED.
-There is no "almost correct"."""
-
-    def _clean_input(self, text: str) -> str:
-        """Remove filler and forbidden words from input."""
-        filler_patterns = [
-            r'\b(please|kindly|could you|can you|i want to|i need to|i would like to)\b',
-            r'\b(maybe|possibly|perhaps|something like|sort of|kind of)\b',
-            r'\b(basically|actually|honestly|literally)\b',
-        ]
-        
-        for pattern in filler_patterns:
-            text = re.sub(pattern, '', text, flags=re.IGNORECASE)
-        
-        text = ' '.join(text.split())
-        return text.strip()
-    
-    def _resolve_framework(self, name: str) -> Tuple[Framework, float]:
-        """Resolve framework from explicit name."""
-        name = name.lower().strip()
-        
-        for fw in Framework:
-            if fw.value == name or fw.name.lower() == name:
-                return fw, 1.0
-        
-        for fw in Framework:
-            if name in fw.value or name in fw.name.lower():
-                return fw, 0.9
-        
-        keyword_map = {
-            "coding": Framework.CODING,
-            "code": Framework.CODING,
-            "build": Framework.CODING,
-            "teaching": Framework.TEACHING,
-            "learn": Framework.TEACHING,
-            "explain": Framework.EXPLANATION,
-            "research": Framework.RESEARCH,
-            "analyze": Framework.RESEARCH,
-            "creative": Framework.CREATIVE,
-            "design": Framework.CREATIVE,
-            "strategy": Framework.STRATEGY,
-            "decide": Framework.STRATEGY,
-            "content": Framework.CONTENT,
-            "write": Framework.CONTENT,
-        }
-        
-        for keyword, fw in keyword_map.items():
-            if keyword in name:
-                return fw, 0.8
-        
-        return Framework.CODING, 0.5
-    
     def _clean_input(self, text: str) -> str:
         """Remove filler and forbidden words from input."""
-        # Remove filler phrases
-        filler_patterns = [
-            r'\b(please|kindly|could you|can you|i want to|i need to|i would like to)\b',
-            r'\b(maybe|possibly|perhaps|something like|sort of|kind of)\b',
-            r'\b(basically|actually|honestly|literally)\b',
-        ]
-        
-        for pattern in filler_patterns:
-            text = re.sub(pattern, '', text, flags=re.IGNORECASE)
-        
-        # Clean whitespace
-        text = ' '.join(text.split())
-        return text.strip()
+        # Strip filler, then collapse whitespace
+        return " ".join(_FILLER_RE.sub("", text).split())
     
     def _resolve_framework(self, name: str) -> Tuple[Framework, float]:
         """Resolve framework from explicit name."""
         name = name.lower().strip()
         
-        # Direct match by value
-        for fw in Framework:
-            if fw.value == name or fw.name.lower() == name:
-                return fw, 1.0
+        # Direct match by value or member name
+        fw = _FRAMEWORK_IDS.get(name)
+        if fw is not None:
+            return fw, 1.0
         
         # Partial match
-        for fw in Framework:
-            if name in fw.value or name in fw.name.lower():
+        for fw, value, member_name in _FRAMEWORK_NAMES:
+            if name in value or name in member_name:
                 return fw, 0.9
         
         # Keyword match
-        keyword_map = {
-            "coding": Framework.CODING,
-            "code": Framework.CODING,
-            "build": Framework.CODING,
-            "teaching": Framework.TEACHING,
-            "learn": Framework.TEACHING,
-            "explain": Framework.EXPLANATION,
-            "research": Framework.RESEARCH,
-            "analyze": Framework.RESEARCH,
-            "creative": Framework.CREATIVE,
-            "design": Framework.CREATIVE,
-            "strategy": Framework.STRATEGY,
-            "decide": Framework.STRATEGY,
-            "content": Framework.CONTENT,
-            "write": Framework.CONTENT,
-        }
-        
-        for keyword, fw in keyword_map.items():
+        for keyword, fw in _FRAMEWORK_KEYWORDS:
             if keyword in name:
                 return fw, 0.8
         
@@ -1051,10 +1239,50 @@ class PromptOptimizationSystem:
     GUARANTEE: No forbidden language appears.
     """
     
+    BATCH_CONCURRENCY = 5  # Max LLM calls in flight per process_batch()
+    
     def __init__(self, llm_provider: Optional[LLMProvider] = None):
         self.registry = FrameworkRegistry()
         self.llm_provider = llm_provider or GroqProvider()
         self.optimizer = PromptOptimizer(self.registry, self.llm_provider)
+        
+        # Framework listings are static: build them once, share on every call
+        # (process() results embed the summary dicts; do not mutate them)
+        self._framework_summaries: Dict[Framework, Tuple[Dict[str, Any], str]] = {
+            spec.framework: (
+                {
+                    "id": spec.framework.value,
+                    "name": spec.name,
+                    "description": spec.description,
+                    "role": spec.targets[0] if spec.targets else "Expert",
+                },
+                f"Classified as {spec.name}",
+            )
+            for spec in self.registry.get_all()
+        }
+        self._framework_list: Tuple[Dict[str, Any], ...] = tuple(
+            {
+                "id": spec.framework.value,
+                "name": spec.name,
+                "description": spec.description,
+                "ideal_for": spec.ideal_for,
+                "example_inputs": spec.triggers[:5],
+                "role_personas": spec.targets,
+            }
+            for spec in self.registry.get_all()
+        )
+        self._framework_details: Dict[str, Dict[str, Any]] = {
+            spec.framework.value: {
+                "id": spec.framework.value,
+                "name": spec.name,
+                "description": spec.description,
+                "ideal_for": spec.ideal_for,
+                "trigger_keywords": spec.triggers,
+                "example_inputs": spec.triggers[:5],
+                "role_personas": spec.targets,
+            }
+            for spec in self.registry.get_all()
+        }
     
     def process(
         self,
@@ -1088,58 +1316,75 @@ class PromptOptimizationSystem:
             explicit_framework=explicit_framework,
             force_static=force_static,
         )
-        spec = self.registry.get(result.framework)
+        framework, reasoning = self._framework_summaries[result.framework]
         
         return {
             "original_input": user_input,
             "optimized_prompt": result.prompt,
-            "framework": {
-                "id": result.framework.value,
-                "name": result.framework_name,
-                "description": spec.description,
-                "role": spec.targets[0] if spec.targets else "Expert",
-            },
+            "framework": framework,
             "confidence": result.confidence,
-            "reasoning": f"Classified as {result.framework_name}",
+            "reasoning": reasoning,
             "generation_mode": result.generation_mode,
             "valid": result.valid,
-            "violations": result.violations,
+            "violations": list(result.violations),
         }
     
+    def process_batch(
+        self,
+        inputs: List[str],
+        explicit_framework: Optional[str] = None,
+        force_static: bool = False,
+        max_workers: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Process several inputs concurrently.
+        
+        Each input is a blocking LLM round-trip, so inputs run on a thread
+        pool bounded by max_workers (default: BATCH_CONCURRENCY); the
+        shared provider session pools the connections. Duplicate inputs
+        are processed once and share the same result dict.
+        
+        Args:
+            inputs: Prompts to optimize
+            explicit_framework: Force a specific framework for every input
+            force_static: Skip LLM for every input
+            max_workers: Concurrency bound (optional)
+        
+        Returns:
+            One process() result per input, in input order
+        
+        Raises:
+            ValueError: If any input is empty or invalid
+        """
+        def run(user_input: str) -> Dict[str, Any]:
+            return self.process(user_input, explicit_framework, force_static)
+        
+        unique = list(dict.fromkeys(inputs))
+        
+        if len(unique) <= 1 or force_static:
+            # Nothing to overlap: static structuring is CPU-bound
+            results = [run(user_input) for user_input in unique]
+        else:
+            workers = min(max_workers or self.BATCH_CONCURRENCY, len(unique))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(run, unique))
+        
+        if len(unique) == len(inputs):
+            return results
+        by_input = dict(zip(unique, results))
+        return [by_input[user_input] for user_input in inputs]
+    
     def list_frameworks(self) -> List[Dict[str, Any]]:
-        """List all frameworks."""
-        return [
-            {
-                "id": spec.framework.value,
-                "name": spec.name,
-                "description": spec.description,
-                "ideal_for": spec.ideal_for,
-                "example_inputs": spec.triggers[:5],
-                "role_personas": spec.targets,
-            }
-            for spec in self.registry.get_all()
-        ]
+        """List all frameworks (entries are shared; do not mutate)."""
+        return list(self._framework_list)
     
     def list_available_frameworks(self) -> List[Dict[str, Any]]:
         """Alias for backward compatibility."""
         return self.list_frameworks()
     
     def get_framework(self, framework_id: str) -> Optional[Dict[str, Any]]:
-        """Get framework details."""
-        try:
-            fw = Framework(framework_id)
-            spec = self.registry.get(fw)
-            return {
-                "id": spec.framework.value,
-                "name": spec.name,
-                "description": spec.description,
-                "ideal_for": spec.ideal_for,
-                "trigger_keywords": spec.triggers,
-                "example_inputs": spec.triggers[:5],
-                "role_personas": spec.targets,
-            }
-        except (ValueError, KeyError):
-            return None
+        """Get framework details (shared; do not mutate)."""
+        return self._framework_details.get(framework_id)
     
     def get_framework_by_id(self, framework_id: str) -> Optional[Dict[str, Any]]:
         """Alias for backward compatibility."""
@@ -1170,12 +1415,13 @@ def main():
         "help me decide which framework to use",
     ]
     
-    for user_input in test_inputs:
+    # All inputs run concurrently; results come back in input order
+    results = system.process_batch(test_inputs)
+    
+    for user_input, result in zip(test_inputs, results):
         print(f"\n{'-' * 70}")
         print(f"INPUT: \"{user_input}\"")
         
-        result = system.process(user_input)
-        
         print(f"Framework: {result['framework']['name']}")
         print(f"Valid: {result['valid']}")
         if result['violations']:
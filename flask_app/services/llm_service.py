@@ -38,9 +38,13 @@ Usage:
 
 import logging
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional, Dict, Any
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Module-level logger for LLM service operations
 logger = logging.getLogger(__name__)
@@ -81,7 +85,7 @@ class LLMError(Exception):
 # RESPONSE DATACLASS
 # =============================================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LLMResponse:
     """
     Structured response from LLM API calls.
@@ -90,6 +94,7 @@ class LLMResponse:
     - Type hints for IDE support
     - Automatic __init__, __repr__, etc.
     - Clean attribute access (response.content vs response['content'])
+    - Immutability and no per-instance __dict__ (frozen, slots)
     
     Attributes:
         content (str): The generated text content from the LLM
@@ -110,6 +115,36 @@ class LLMResponse:
     finish_reason: Optional[str] = None       # Completion reason
 
 
+# =============================================================================
+# SYSTEM MESSAGE CACHE
+# =============================================================================
+
+@lru_cache(maxsize=512)
+def _system_message(
+    framework_name: str,
+    framework_desc: str,
+    role_template: str,
+    confidence_pct: int,
+) -> str:
+    """
+    Build (and cache) the system message for a framework context.
+    
+    Framework fields come from a small fixed registry and confidence is
+    bucketed to 5% steps, so the set of distinct messages is bounded and
+    nearly every call after warmup is a cache hit.
+    """
+    return f"""You are a prompt engineering specialist. 
+Your task is to improve and optimize user prompts based on the following framework and context.
+
+Framework: {framework_name}
+Description: {framework_desc}
+Role/Context: {role_template}
+Confidence: {confidence_pct}%
+
+Take the user's raw prompt and rewrite it to be more systematic, structured, and result-oriented using the specified framework principles.
+Return ONLY the optimized prompt, nothing else."""
+
+
 # =============================================================================
 # LLM SERVICE CLASS
 # =============================================================================
@@ -127,6 +162,10 @@ class LLMService:
         model (str): LLM model to use
         timeout (int): Request timeout in seconds
     
+    A single requests.Session is held per service so TCP/TLS connections
+    to the API are kept alive and reused across requests instead of
+    paying a fresh handshake on every call.
+    
     Example:
         service = LLMService(
             api_key="gsk_...",
@@ -171,18 +210,31 @@ class LLMService:
         self.model = model
         self.timeout = timeout
 
-    def _get_headers(self) -> Dict[str, str]:
-        """
-        Get HTTP headers for API requests.
-        
-        Returns:
-            dict: Headers including Authorization and Content-Type
-        """
-        return {
-            "Authorization": f"Bearer {self.api_key}",
+        # Headers never change for a given key, so build them once
+        self._headers: Dict[str, str] = {
+            "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json",
         }
 
+        # Pooled keep-alive session shared by all requests (thread-safe for
+        # concurrent POSTs); connect errors and transient gateway errors are
+        # retried briefly. Read timeouts are not retried: the POST may already
+        # be generating (and billing) upstream, and a retry would double the wait
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(
+                total=2,
+                read=0,
+                backoff_factor=0.1,
+                status_forcelist=[502, 503, 504],
+                allowed_methods=frozenset({"POST"}),
+                raise_on_status=False,  # Return the last response as-is
+            ),
+        )
+        self._session.mount("https://", adapter)
+
     # -------------------------------------------------------------------------
     # Main Public Method
     # -------------------------------------------------------------------------
@@ -267,21 +319,16 @@ class LLMService:
             framework_name: Name of the optimization framework
             framework_desc: Description of the framework
             role_template: Role persona to adopt
-            confidence: Detection confidence percentage
+            confidence: Detection confidence (0.0 to 1.0), rounded to
+                the nearest 5% for caching
         
         Returns:
             str: Formatted system message for the LLM
         """
-        return f"""You are a prompt engineering specialist. 
-Your task is to improve and optimize user prompts based on the following framework and context.
-
-Framework: {framework_name}
-Description: {framework_desc}
-Role/Context: {role_template}
-Confidence: {confidence:.0%}
-
-Take the user's raw prompt and rewrite it to be more systematic, structured, and result-oriented using the specified framework principles.
-Return ONLY the optimized prompt, nothing else."""
+        confidence_pct = round(confidence * 20) * 5
+        return _system_message(
+            framework_name, framework_desc, role_template, confidence_pct
+        )
 
     def _make_chat_request(
         self,
@@ -329,17 +376,18 @@ Return ONLY the optimized prompt, nothing else."""
                 extra={"model": self.model, "prompt_length": len(user_message)},
             )
 
-            # Make the HTTP POST request
-            response = requests.post(
+            # Make the HTTP POST request over the pooled session
+            # (body encoded with orjson; Content-Type is in self._headers)
+            response = self._session.post(
                 self.api_url,
-                headers=self._get_headers(),
-                json=payload,
+                headers=self._headers,
+                data=orjson.dumps(payload),
                 timeout=self.timeout,
             )
 
             # Handle successful response
             if response.status_code == 200:
-                return self._parse_response(response.json())
+                return self._parse_response(orjson.loads(response.content))
             
             # Handle API error responses
             else:
@@ -361,8 +409,8 @@ Return ONLY the optimized prompt, nothing else."""
                 status_code=504,  # Gateway Timeout
             )
         
-        # Handle connection/network errors
-        except requests.exceptions.RequestException as e:
+        # Handle connection/network errors (and undecodable response bodies)
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             logger.error("LLM API request failed", extra={"error": str(e)})
             raise LLMError(
                 message=f"LLM API request failed: {str(e)}",
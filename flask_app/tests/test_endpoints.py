@@ -21,6 +21,67 @@ class TestHealthEndpoint:
         assert data["status"] == "healthy"
 
 
+class TestJSONProvider:
+    """Tests for the orjson-backed jsonify output format."""
+
+    def test_keys_sorted(self, app):
+        """Test jsonify keeps Flask's sorted key order."""
+        from flask import jsonify
+
+        with app.app_context():
+            response = jsonify({"b": 1, "a": {"d": 2, "c": 3}})
+        assert response.get_data() == b'{"a":{"c":3,"d":2},"b":1}\n'
+
+    def test_non_ascii_emitted_as_utf8(self, app):
+        """Test non-ASCII text is written as raw UTF-8, not \\u escapes."""
+        from flask import jsonify
+
+        with app.app_context():
+            response = jsonify({"text": "caf\u00e9"})
+        assert response.get_data() == '{"text":"caf\u00e9"}\n'.encode("utf-8")
+        assert response.mimetype == "application/json"
+
+
+class TestLazyLLMService:
+    """Tests for deferred LLM service construction."""
+
+    def test_health_reports_llm_without_building_it(self, client):
+        """Test /health reports availability before any /chat request."""
+        import app as app_module
+
+        response = client.get("/health")
+        data = json.loads(response.data)
+        assert data["llm_available"] is True
+        assert app_module.llm_service is None
+
+    def test_service_built_on_first_chat(self, client, sample_prompt):
+        """Test the LLM service is constructed by the first /chat request."""
+        import app as app_module
+        from services.llm_service import LLMService, LLMResponse
+
+        with patch("prompt_optimizer.GroqProvider.generate", return_value=None):
+            client.post(
+                "/optimize",
+                data=json.dumps({"prompt": sample_prompt}),
+                content_type="application/json",
+            )
+        assert app_module.llm_service is None
+
+        with patch.object(
+            LLMService,
+            "optimize_prompt",
+            return_value=LLMResponse(content="Optimized", model="test-model"),
+        ):
+            response = client.post(
+                "/chat",
+                data=json.dumps({"prompt": sample_prompt}),
+                content_type="application/json",
+            )
+
+        assert response.status_code == 200
+        assert isinstance(app_module.llm_service, LLMService)
+
+
 class TestFrameworksEndpoint:
     """Tests for /frameworks endpoint."""
 
@@ -119,6 +180,17 @@ class TestOptimizeEndpoint:
         )
         assert response.status_code == 400
 
+    def test_optimize_rejects_malformed_json(self, client):
+        """Test optimize rejects a body that is not valid JSON."""
+        response = client.post(
+            "/optimize",
+            data='{"prompt": ',
+            content_type="application/json",
+        )
+        assert response.status_code == 400
+        data = json.loads(response.data)
+        assert "JSON" in data["error"]
+
     def test_optimize_requires_json_content_type(self, client, sample_prompt):
         """Test optimize requires JSON content type."""
         response = client.post(
@@ -128,6 +200,24 @@ class TestOptimizeEndpoint:
         )
         assert response.status_code == 415
 
+    def test_optimize_rejects_embedded_json_content_type(self, client, sample_prompt):
+        """Test Content-Type must start with application/json."""
+        response = client.post(
+            "/optimize",
+            data=f'{{"prompt": "{sample_prompt}"}}',
+            content_type="text/x-application/json",
+        )
+        assert response.status_code == 415
+
+    def test_optimize_accepts_json_content_type_params(self, client, sample_prompt):
+        """Test Content-Type parameters (charset) are allowed."""
+        response = client.post(
+            "/optimize",
+            data=f'{{"prompt": "{sample_prompt}"}}',
+            content_type="application/json; charset=utf-8",
+        )
+        assert response.status_code == 200
+
 
 class TestChatEndpoint:
     """Tests for /chat endpoint."""
@@ -221,6 +311,18 @@ class TestInputValidation:
         )
         assert response.status_code == 400
 
+    @pytest.mark.parametrize("encoding", ["utf-8-sig", "utf-16", "utf-16-le", "utf-32"])
+    def test_accepts_non_utf8_json_encodings(self, client, sample_prompt, encoding):
+        """Test UTF-16/32 and BOM-prefixed bodies parse like get_json()."""
+        with patch("prompt_optimizer.GroqProvider.generate", return_value=None):
+            response = client.post(
+                "/optimize",
+                data=json.dumps({"prompt": sample_prompt}).encode(encoding),
+                content_type="application/json",
+            )
+        assert response.status_code == 200
+        assert json.loads(response.data)["original_input"] == sample_prompt
+
     def test_accepts_valid_special_characters(self, client):
         """Test valid prompts with special characters work."""
         response = client.post(
@@ -264,3 +366,35 @@ class TestRequestTracking:
         """Test response includes timing header."""
         response = client.get("/health")
         assert "X-Response-Time" in response.headers
+
+
+class TestProcessCache:
+    """Tests for the per-app optimization result cache."""
+
+    def test_static_result_cached_without_llm(self, app, client, sample_prompt):
+        """Test results are cached when no LLM is available."""
+        with patch("app.prompt_system.is_dynamic_available", return_value=False):
+            client.post(
+                "/optimize",
+                data=json.dumps({"prompt": sample_prompt}),
+                content_type="application/json",
+            )
+        assert len(app.extensions["process_cache"]) == 1
+
+    def test_static_fallback_not_cached(self, app, client, sample_prompt):
+        """Test static fallbacks are not cached while an LLM is configured."""
+        with patch("prompt_optimizer.GroqProvider.generate", return_value=None):
+            response = client.post(
+                "/optimize",
+                data=json.dumps({"prompt": sample_prompt}),
+                content_type="application/json",
+            )
+        assert json.loads(response.data)["generation_mode"] == "static"
+        assert len(app.extensions["process_cache"]) == 0
+
+    def test_cache_is_per_app(self, app):
+        """Test each app instance gets its own cache."""
+        from app import create_app
+
+        other = create_app()
+        assert other.extensions["process_cache"] is not app.extensions["process_cache"]
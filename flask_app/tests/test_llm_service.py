@@ -1,5 +1,6 @@
 """Tests for LLM service."""
 
+import orjson
 import pytest
 from unittest.mock import patch, Mock
 
@@ -32,12 +33,12 @@ class TestLLMService:
         assert service.model == "custom-model"
         assert service.timeout == 60
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_optimize_prompt_success(self, mock_post):
         """Test successful prompt optimization."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = orjson.dumps({
             "choices": [
                 {
                     "message": {"content": "Optimized prompt content"},
@@ -46,7 +47,7 @@ class TestLLMService:
             ],
             "model": "test-model",
             "usage": {"prompt_tokens": 10, "completion_tokens": 20},
-        }
+        })
         mock_post.return_value = mock_response
 
         service = LLMService(api_key="test-key")
@@ -62,7 +63,7 @@ class TestLLMService:
         assert result.content == "Optimized prompt content"
         assert result.model == "test-model"
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_optimize_prompt_api_error(self, mock_post):
         """Test API error handling."""
         mock_response = Mock()
@@ -83,7 +84,28 @@ class TestLLMService:
 
         assert exc.value.status_code == 500
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
+    def test_optimize_prompt_malformed_body(self, mock_post):
+        """Test undecodable API response body."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = b"<html>not json</html>"
+        mock_post.return_value = mock_response
+
+        service = LLMService(api_key="test-key")
+
+        with pytest.raises(LLMError) as exc:
+            service.optimize_prompt(
+                user_prompt="Test",
+                framework_name="Test",
+                framework_desc="Test",
+                role_template="Test",
+                confidence=0.5,
+            )
+
+        assert exc.value.status_code == 502
+
+    @patch("requests.Session.post")
     def test_optimize_prompt_timeout(self, mock_post):
         """Test timeout handling."""
         import requests as req
@@ -103,7 +125,7 @@ class TestLLMService:
 
         assert exc.value.status_code == 504
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_optimize_prompt_connection_error(self, mock_post):
         """Test connection error handling."""
         import requests as req
@@ -124,6 +146,17 @@ class TestLLMService:
         assert exc.value.status_code == 502
 
 
+    def test_system_message_buckets_confidence(self):
+        """Test confidence is rounded to 5% steps and messages are cached."""
+        service = LLMService(api_key="test-key")
+
+        first = service._build_system_message("Name", "Desc", "Role", 0.86)
+        second = service._build_system_message("Name", "Desc", "Role", 0.84)
+
+        assert "Confidence: 85%" in first
+        assert first is second
+
+
 class TestLLMResponse:
     """Tests for LLMResponse dataclass."""
 
@@ -149,6 +182,15 @@ class TestLLMResponse:
         assert response.usage is None
         assert response.finish_reason is None
 
+    def test_response_is_immutable(self):
+        """Test LLMResponse fields cannot be reassigned."""
+        import dataclasses
+
+        response = LLMResponse(content="Test", model="model")
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            response.content = "Changed"
+
 
 class TestLLMError:
     """Tests for LLMError class."""
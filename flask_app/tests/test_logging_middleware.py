@@ -0,0 +1,70 @@
+"""Tests for request logging middleware."""
+
+import logging
+
+import pytest
+from flask import Flask
+
+from middleware.logging_middleware import init_request_logging
+
+
+@pytest.fixture
+def sampled_app():
+    """Minimal app logging 1 in 3 requests."""
+    app = Flask("sampled")
+    app.config["LOG_SAMPLE_RATE"] = 3
+    init_request_logging(app)
+
+    @app.route("/ok")
+    def ok():
+        return "ok"
+
+    @app.route("/fail/<int:status>")
+    def fail(status):
+        return "fail", status
+
+    return app
+
+
+def _completed(caplog):
+    """Request-completed log lines captured so far."""
+    return [r.getMessage() for r in caplog.records if "Request completed" in r.getMessage()]
+
+
+class TestLogSampling:
+    """Tests for LOG_SAMPLE_RATE request sampling."""
+
+    def test_logs_every_nth_request(self, sampled_app, caplog):
+        """Test only every Nth successful request is logged."""
+        caplog.set_level(logging.INFO, logger=sampled_app.logger.name)
+        client = sampled_app.test_client()
+
+        for _ in range(7):
+            assert client.get("/ok").status_code == 200
+
+        # Requests 1, 4 and 7 are sampled
+        assert len(_completed(caplog)) == 3
+
+    @pytest.mark.parametrize("status", [404, 500])
+    def test_errors_always_logged(self, sampled_app, caplog, status):
+        """Test 4xx/5xx responses are logged even when not sampled."""
+        caplog.set_level(logging.INFO, logger=sampled_app.logger.name)
+        client = sampled_app.test_client()
+
+        client.get("/ok")  # sampled; the next two are not
+        for _ in range(2):
+            assert client.get(f"/fail/{status}").status_code == status
+
+        completed = _completed(caplog)
+        assert len(completed) == 3
+        assert all(f"- {status} " in line for line in completed[1:])
+
+    def test_headers_added_when_not_sampled(self, sampled_app):
+        """Test tracking headers are set on unsampled responses."""
+        client = sampled_app.test_client()
+
+        client.get("/ok")
+        response = client.get("/ok")
+
+        assert "X-Request-ID" in response.headers
+        assert "X-Response-Time" in response.headers
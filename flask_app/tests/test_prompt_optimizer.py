@@ -0,0 +1,198 @@
+"""Tests for the prompt optimizer engine."""
+
+import orjson
+import pytest
+from unittest.mock import Mock
+
+from prompt_optimizer import (
+    GroqProvider,
+    LLMProvider,
+    MANDATORY_SECTIONS,
+    PromptOptimizationSystem,
+    PromptOptimizer,
+    _FORBIDDEN_RE,
+)
+
+VALID_OUTPUT = "\n".join(f"{section}\nDefined." for section in MANDATORY_SECTIONS)
+
+
+class ScriptedProvider(LLMProvider):
+    """Provider returning queued generate() results; repeats the last one."""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.calls = []
+
+    @property
+    def is_available(self):
+        return True
+
+    def generate(self, system_prompt, user_input, **kwargs):
+        self.calls.append(user_input)
+        if len(self.results) > 1:
+            return self.results.pop(0)
+        return self.results[0]
+
+
+def _sse_response(*deltas):
+    """Build a mock streamed response yielding one SSE line per delta."""
+    lines = [b": keep-alive", b'data: {"choices": [{"delta": {"role": "assistant"}}]}']
+    lines += [
+        b"data: " + orjson.dumps({"choices": [{"delta": {"content": d}}]})
+        for d in deltas
+    ]
+    lines.append(b"data: [DONE]")
+    response = Mock()
+    response.iter_lines.return_value = iter(lines)
+    return response
+
+
+class TestGroqStreamReader:
+    """Tests for GroqProvider._read_stream."""
+
+    def test_reads_full_stream(self):
+        """Test a clean stream is returned in full."""
+        response = _sse_response("ROLE\n", "Senior ", "Engineer")
+        text, aborted = GroqProvider._read_stream(response, _FORBIDDEN_RE)
+        assert text == "ROLE\nSenior Engineer"
+        assert not aborted
+
+    def test_aborts_at_forbidden_word(self):
+        """Test the stream stops once a forbidden word is complete."""
+        response = _sse_response("Use React ", "or ", "Vue ", "for ", "the ", "UI")
+        text, aborted = GroqProvider._read_stream(response, _FORBIDDEN_RE)
+        assert text == "Use React or "
+        assert aborted
+
+    def test_partial_word_does_not_abort(self):
+        """Test a word prefix matching a forbidden word is not rejected early."""
+        response = _sse_response("Place ", "or", "der ", "now")
+        text, aborted = GroqProvider._read_stream(response, _FORBIDDEN_RE)
+        assert text == "Place order now"
+        assert not aborted
+
+    def test_phrase_split_across_chunks(self):
+        """Test multi-word phrases spanning scan boundaries are caught."""
+        response = _sse_response("It ", "can ", "be ", "done ", "later")
+        text, aborted = GroqProvider._read_stream(response, _FORBIDDEN_RE)
+        assert text == "It can be "
+        assert aborted
+
+
+class TestAbortedGeneration:
+    """Tests for how PromptOptimizer handles aborted streams."""
+
+    def test_aborted_output_reports_only_forbidden_words(self):
+        """Test retry feedback for partial output omits missing sections."""
+        provider = ScriptedProvider(("ROLE\nUse React or ", True), (VALID_OUTPUT, False))
+        optimizer = PromptOptimizer(llm_provider=provider)
+
+        result = optimizer.optimize("Build a dashboard in React")
+
+        assert result.generation_mode == "dynamic"
+        retry_prompt = provider.calls[1]
+        assert "Forbidden word detected: 'or'" in retry_prompt
+        assert "Missing mandatory section" not in retry_prompt
+
+
+class TestProcessBatch:
+    """Tests for PromptOptimizationSystem.process_batch."""
+
+    def test_results_follow_input_order(self):
+        """Test results line up with inputs despite concurrent execution."""
+        system = PromptOptimizationSystem(ScriptedProvider((VALID_OUTPUT, False)))
+        inputs = ["Build a REST API", "Write a blog post", "Plan a product launch"]
+
+        results = system.process_batch(inputs)
+
+        assert [r["original_input"] for r in results] == inputs
+        assert all(r["generation_mode"] == "dynamic" for r in results)
+
+    def test_repeated_inputs_processed_once(self):
+        """Test duplicate prompts share one generation and one result."""
+        provider = ScriptedProvider((VALID_OUTPUT, False))
+        system = PromptOptimizationSystem(provider)
+        inputs = ["Build a REST API", "Write a blog post", "Build a REST API"]
+
+        results = system.process_batch(inputs)
+
+        assert len(results) == 3
+        assert len(provider.calls) == 2
+        assert results[0] is results[2]
+
+    def test_blank_input_raises(self):
+        """Test a blank prompt fails the whole batch with ValueError."""
+        system = PromptOptimizationSystem(ScriptedProvider((VALID_OUTPUT, False)))
+
+        with pytest.raises(ValueError):
+            system.process_batch(["Build a REST API", "   "])
+
+
+class TestGenerationCache:
+    """Tests for PromptOptimizer's cache of validated LLM outputs."""
+
+    def test_repeat_input_served_from_cache(self):
+        """Test a validated output is reused for the same input."""
+        provider = ScriptedProvider((VALID_OUTPUT, False))
+        optimizer = PromptOptimizer(llm_provider=provider)
+
+        first = optimizer.optimize("Build a REST API")
+        second = optimizer.optimize("Build  a REST API ")
+
+        assert len(provider.calls) == 1
+        assert second.prompt == first.prompt
+        assert second.generation_mode == "dynamic"
+
+    def test_evicts_least_recently_used(self):
+        """Test the oldest entry is dropped once the cache is full."""
+        provider = ScriptedProvider((VALID_OUTPUT, False))
+        optimizer = PromptOptimizer(llm_provider=provider)
+        optimizer.GENERATION_CACHE_SIZE = 2
+
+        optimizer.optimize("Build a REST API")
+        optimizer.optimize("Write a blog post")
+        optimizer.optimize("Build a REST API")  # hit; now most recent
+        optimizer.optimize("Plan a product launch")  # evicts the blog post
+        assert len(provider.calls) == 3
+
+        optimizer.optimize("Build a REST API")
+        assert len(provider.calls) == 3
+        optimizer.optimize("Write a blog post")
+        assert len(provider.calls) == 4
+
+    def test_failed_generation_not_cached(self):
+        """Test a static fallback after LLM failure is not cached."""
+        provider = ScriptedProvider(None)
+        optimizer = PromptOptimizer(llm_provider=provider)
+
+        result = optimizer.optimize("Build a REST API")
+        assert result.generation_mode == "static"
+        attempts = len(provider.calls)
+
+        optimizer.optimize("Build a REST API")
+        assert len(provider.calls) == 2 * attempts
+        assert not optimizer._generation_cache
+
+
+class TestStaticCache:
+    """Tests for PromptOptimizer's memoized static structuring."""
+
+    def test_forced_and_fallback_paths_share_entry(self):
+        """Test forced-static and LLM-fallback results use one cache key."""
+        optimizer = PromptOptimizer(llm_provider=ScriptedProvider(None))
+
+        forced = optimizer.optimize("Build a REST API", force_static=True)
+        fallback = optimizer.optimize("Build a REST API")
+
+        assert fallback is forced
+        assert optimizer._structure_static.cache_info().currsize == 1
+
+    def test_violations_not_shared_with_callers(self):
+        """Test process() results cannot mutate the cached violations."""
+        system = PromptOptimizationSystem(ScriptedProvider(None))
+
+        first = system.process("Build a REST API", force_static=True)
+        first["violations"].append("tampered")
+        second = system.process("Build a REST API", force_static=True)
+
+        assert "tampered" not in second["violations"]
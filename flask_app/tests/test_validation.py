@@ -76,6 +76,32 @@ class TestValidatePromptInput:
             validate_prompt_input({"prompt": "test {{injection}}"})
         assert "invalid" in exc.value.message.lower()
 
+    def test_suspicious_patterns_case_insensitive(self):
+        """Test suspicious patterns match regardless of case."""
+        with pytest.raises(ValidationError):
+            validate_prompt_input({"prompt": "<SCRIPT>alert('test')</SCRIPT>"})
+
+    def test_multiline_template_injection_rejected(self):
+        """Test template injection spanning lines is rejected."""
+        with pytest.raises(ValidationError):
+            validate_prompt_input({"prompt": "test {{\ninjection\n}}"})
+
+    def test_nested_template_opener_rejected(self):
+        """Test a closer after a later opener is still caught."""
+        with pytest.raises(ValidationError):
+            validate_prompt_input({"prompt": "test {{ a {{ b }}"})
+
+    def test_distant_braces_accepted(self):
+        """Test an opener and a closer far apart are not paired."""
+        text = "Explain {{ in Jinja. " + "Some detail. " * 40 + "Then explain }} too."
+        prompt, _ = validate_prompt_input({"prompt": text})
+        assert prompt == text
+
+    def test_unclosed_braces_accepted(self):
+        """Test long runs of unclosed braces are not treated as injection."""
+        prompt, _ = validate_prompt_input({"prompt": "{" * 5000})
+        assert len(prompt) == 5000
+
     def test_null_data_raises_error(self):
         """Test null data raises ValidationError."""
         with pytest.raises(ValidationError) as exc: